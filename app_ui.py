@@ -4,14 +4,18 @@
 Interface gráfica para extração de texto de PDFs judiciais brasileiros.
 """
 
+import collections
+import concurrent.futures
+import errno
+import functools
+import multiprocessing
 import os
 import shutil
 import sys
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
-import webview
-from dotenv import load_dotenv
-
 from src.extractors import PyMuPDFExtractor
 from src.formatters import MarkdownFormatter
 from src.processors import (
@@ -20,12 +24,17 @@ from src.processors import (
     TextNormalizer,
     format_image_description_markdown,
 )
-from src.utils.config import get_config
+from src.utils.config import get_config, load_env_file
+from src.utils.constants import MAX_DETAILED_ITEMS
 from src.utils.exceptions import PDFExtractionError
 from src.utils.logger import get_logger, setup_logger
+from src.utils.patterns import RegexPatterns
+
+# Application root: PyInstaller's bundle folder (_MEIPASS) or this file's directory
+_BASE_PATH = Path(getattr(sys, "_MEIPASS", Path(__file__).parent))
 
 
-def get_resource_path(relative_path: str) -> Path:
+def get_resource_path(relative_path: str | os.PathLike) -> Path:
     """Get absolute path to resource, works for dev and for PyInstaller.
 
     Args:
@@ -34,15 +43,11 @@ def get_resource_path(relative_path: str) -> Path:
     Returns:
         Absolute path to the resource
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = Path(sys._MEIPASS)  # type: ignore
-    except AttributeError:
-        # Running in normal Python environment
-        base_path = Path(__file__).parent
+    return _BASE_PATH / relative_path
 
-    return base_path / relative_path
 
+# Load environment variables from .env file (before the configuration reads them)
+load_env_file(get_resource_path(".env"))
 
 # Load configuration
 config = get_config()
@@ -51,33 +56,47 @@ config = get_config()
 setup_logger(log_level=config.log_level, log_file=config.log_file)
 logger = get_logger(__name__)
 
+# Last generated file, persisted so "Save As"/"Open folder" survive a GUI reload
+_STATE_PATH = Path(tempfile.gettempdir()) / "pdf2md_last_output.txt"
 
-def safe_move_file(src: Path, dest: Path, create_backup: bool = False) -> bool:
+
+def safe_move_file(
+    src: Path, dest: Path, create_backup: bool = False, skip_mkdir: bool = False
+) -> bool:
     """Safely move a file with error handling.
 
     Args:
         src: Source file path
         dest: Destination file path
         create_backup: Whether to backup if destination exists
+        skip_mkdir: Skip creating the destination directory (caller already did)
 
     Returns:
         True if successful, False otherwise
     """
     try:
         # Create destination directory if needed
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        if not skip_mkdir:
+            dest.parent.mkdir(parents=True, exist_ok=True)
 
         # Handle existing destination
         if dest.exists():
             if create_backup:
                 backup_path = dest.with_suffix(dest.suffix + ".bak")
                 logger.warning(f"Destination exists, creating backup: {backup_path}")
-                shutil.copy2(str(dest), str(backup_path))
+                # Rename instead of copying: the original is replaced right after
+                os.replace(dest, backup_path)
             else:
                 logger.warning(f"Destination exists, will overwrite: {dest}")
 
-        # Perform move
-        shutil.move(str(src), str(dest))
+        # Perform move (atomic rename on the same filesystem)
+        try:
+            os.replace(src, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-device move: fall back to copy + delete
+            shutil.move(src, dest)
         logger.info(f"File moved successfully: {src} -> {dest}")
         return True
 
@@ -94,13 +113,229 @@ def safe_move_file(src: Path, dest: Path, create_backup: bool = False) -> bool:
         return False
 
 
+def _copy_file(src: str | Path, dest: str | Path) -> None:
+    """Copy a file with its metadata, copying in-kernel on Linux.
+
+    Uses os.copy_file_range (no user-space buffers) and falls back to
+    shutil.copy2 where it is unavailable or unsupported by the filesystem.
+
+    Args:
+        src: Source file path
+        dest: Destination file path
+
+    Raises:
+        shutil.SameFileError: If src and dest are the same file
+        OSError: If the copy fails
+    """
+    if os.path.exists(dest) and os.path.samefile(src, dest):
+        raise shutil.SameFileError(f"{src} and {dest} are the same file")
+
+    if sys.platform == "linux" and hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 20):
+                    pass
+            shutil.copystat(src, dest)
+            return
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+
+    shutil.copy2(src, dest)
+
+
+def _load_last_output_path() -> str | None:
+    """Load the last generated file path persisted by a previous session.
+
+    Returns:
+        Path string, or None if nothing was saved or the state file is unreadable
+    """
+    try:
+        return _STATE_PATH.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def _save_last_output_path(output_path: str) -> None:
+    """Persist the last generated file path (best effort).
+
+    Args:
+        output_path: Path of the generated file
+    """
+    try:
+        _STATE_PATH.write_text(output_path, encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not persist last output path: {e}")
+
+
+def _list_pdfs(directory: Path) -> list[Path]:
+    """List the PDF files directly inside a directory.
+
+    Uses os.scandir so only matching entries become Path objects.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        List of PDF paths
+    """
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".pdf") and entry.is_file()
+        ]
+
+
+def _walk_pdfs(directory: Path) -> Iterator[Path]:
+    """Recursively yield PDF files, skipping any processado folder.
+
+    Args:
+        directory: Root directory to walk
+
+    Yields:
+        Path of each PDF found
+    """
+    for dirpath, dirnames, filenames in os.walk(directory):
+        # Prune in place so os.walk never descends into already processed files
+        if "processado" in dirnames:
+            dirnames.remove("processado")
+
+        for filename in filenames:
+            if filename.lower().endswith(".pdf"):
+                yield Path(dirpath) / filename
+
+
+def _prefetch_files(paths: list[Path]) -> None:
+    """Ask the kernel to start reading files in the background (Linux only).
+
+    Issues POSIX_FADV_WILLNEED for every file up front so disk/network reads
+    overlap with parsing of the files processed first. No-op where
+    posix_fadvise is unavailable (Windows, macOS).
+
+    Args:
+        paths: Files that are about to be read
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pipeline() -> tuple[TextNormalizer, MetadataParser, MarkdownFormatter]:
+    """Return the stateless pipeline objects, built once per process.
+
+    Returns:
+        Tuple of (normalizer, metadata_parser, formatter)
+    """
+    return TextNormalizer(), MetadataParser(), MarkdownFormatter()
+
+
+def _process_one_pdf(
+    pdf_path: Path, options: dict, output_dir: Path, processado_dir: Path
+) -> tuple[bool, Path, str | None]:
+    """Extract, format and move a single PDF (batch worker).
+
+    Runs in a worker process, so it must stay at module level to be picklable.
+
+    Args:
+        pdf_path: Path to the PDF file
+        options: Dictionary with options (normalize, metadata)
+        output_dir: Directory where the Markdown file is written
+        processado_dir: Directory where the processed PDF is moved (must exist)
+
+    Returns:
+        Tuple of (success, pdf_path, error message or None)
+    """
+    try:
+        normalizer, metadata_parser, formatter = _get_pipeline()
+
+        # Extract text
+        with PyMuPDFExtractor(pdf_path) as extractor:
+            raw_text = extractor.extract_text()
+
+        # Process text
+        if options.get("normalize", True):
+            processed_text = normalizer.normalize(raw_text)
+            processed_text = normalizer.remove_page_markers(processed_text)
+        else:
+            processed_text = raw_text
+
+        # Extract metadata
+        doc_metadata = metadata_parser.parse(processed_text)
+
+        # Format output
+        output_text = formatter.format(
+            processed_text,
+            doc_metadata,
+            include_metadata_header=options.get("metadata", True),
+        )
+
+        # Save to file
+        output_path = output_dir / (pdf_path.stem + ".md")
+        MarkdownFormatter.save_to_file(output_text, str(output_path))
+
+        # Move processed PDF
+        new_pdf_path = processado_dir / pdf_path.name
+
+        if not safe_move_file(pdf_path, new_pdf_path, skip_mkdir=True):
+            logger.warning(f"Could not move {pdf_path.name}, but extraction succeeded")
+
+        return True, pdf_path, None
+
+    except Exception as e:
+        return False, pdf_path, str(e)
+
+
 class API:
     """Backend API for PyWebview interface."""
 
+    _system = None  # Cached platform.system(), resolved on first open_folder call
+
+    # File dialog filters and webview dialog types (resolved on first dialog)
+    _PDF_FILTER = ("PDF Files (*.pdf)",)
+    _MD_FILTER = ("Markdown Files (*.md)",)
+    _FOLDER = _OPEN = _SAVE = None
+
     def __init__(self):
         """Initialize the API with default state."""
         self._window = None  # Private: prevents serialization to JavaScript
-        self.last_output_path = None  # Store last generated file path
+        self.last_output_path = _load_last_output_path()  # Store last generated file path
+        # Stateless pipeline objects reused across calls (private: not exposed to JS)
+        self._normalizer, self._metadata_parser, self._formatter = _get_pipeline()
+        self._analyzer = None  # Created on first image analysis (see _get_analyzer)
+
+    def _get_analyzer(self) -> ImageAnalyzer:
+        """Return the shared ImageAnalyzer, creating it on first use.
+
+        Avoids reloading GEMINI_API_KEY and reconfiguring the Gemini client on
+        every extraction. A failed construction (e.g. missing API key) is not
+        cached, so the next call retries.
+        """
+        if self._analyzer is None:
+            self._analyzer = ImageAnalyzer()
+        return self._analyzer
+
+    @classmethod
+    def _resolve_dialog_types(cls):
+        """Cache webview's dialog type constants, importing webview on first use."""
+        if cls._OPEN is None:
+            import webview
+
+            cls._FOLDER = webview.FOLDER_DIALOG
+            cls._OPEN = webview.OPEN_DIALOG
+            cls._SAVE = webview.SAVE_DIALOG
 
     def select_folder(self):
         """Open folder selection dialog.
@@ -109,7 +344,8 @@ class API:
             str: Selected folder path
         """
         try:
-            result = self._window.create_file_dialog(webview.FOLDER_DIALOG, allow_multiple=False)
+            self._resolve_dialog_types()
+            result = self._window.create_file_dialog(API._FOLDER, allow_multiple=False)
             if result and len(result) > 0:
                 return result[0]
             return None
@@ -123,8 +359,9 @@ class API:
             str: Selected file path
         """
         try:
+            self._resolve_dialog_types()
             result = self._window.create_file_dialog(
-                webview.OPEN_DIALOG, file_types=("PDF Files (*.pdf)",), allow_multiple=False
+                API._OPEN, file_types=API._PDF_FILTER, allow_multiple=False
             )
             if result and len(result) > 0:
                 return result[0]
@@ -153,12 +390,26 @@ class API:
 
             folder_path = Path(file_path).parent
 
-            if platform.system() == "Windows":
+            if API._system is None:
+                API._system = platform.system()
+
+            if API._system == "Windows":
                 os.startfile(folder_path)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", folder_path])
+            elif API._system == "Darwin":  # macOS
+                # Fire-and-forget: don't block the GUI thread on the file manager
+                subprocess.Popen(
+                    ["open", folder_path],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                )
             else:  # Linux
-                subprocess.run(["xdg-open", folder_path])
+                subprocess.Popen(
+                    ["xdg-open", folder_path],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                )
 
             return {"success": True, "message": f"Pasta aberta: {folder_path}"}
         except Exception as e:
@@ -174,17 +425,16 @@ class API:
             if not self.last_output_path or not Path(self.last_output_path).exists():
                 raise Exception("Nenhum arquivo foi gerado ainda")
 
+            self._resolve_dialog_types()
             result = self._window.create_file_dialog(
-                webview.SAVE_DIALOG,
+                API._SAVE,
                 save_filename=Path(self.last_output_path).name,
-                file_types=("Markdown Files (*.md)",),
+                file_types=API._MD_FILTER,
             )
 
             if result:
                 # Copy file to new location
-                import shutil
-
-                shutil.copy2(self.last_output_path, result)
+                _copy_file(self.last_output_path, result)
                 return {"success": True, "path": result, "message": f"Arquivo salvo em: {result}"}
 
             return {"success": False, "message": "Operação cancelada"}
@@ -209,38 +459,37 @@ class API:
 
             # Extract text and images
             with PyMuPDFExtractor(pdf_path) as extractor:
-                raw_text = extractor.extract_text()
-
-                # Extract images if option is enabled
-                images = []
-                if options.get("analyze_images", False):
-                    images = extractor.extract_images()
+                # Extract images if option is enabled, in the same pass over the pages
+                analyze_images = options.get("analyze_images", False)
+                if analyze_images:
+                    raw_text, images = extractor.extract_text_and_images()
+                else:
+                    raw_text, images = extractor.extract_text(), []
 
             # Process text
             if options.get("normalize", True):
-                normalizer = TextNormalizer()
-                processed_text = normalizer.normalize(raw_text)
-                processed_text = normalizer.remove_page_markers(processed_text)
+                processed_text = self._normalizer.normalize(raw_text)
+                processed_text = self._normalizer.remove_page_markers(processed_text)
+                del raw_text  # Release the raw copy before the remaining passes
             else:
                 processed_text = raw_text
 
             # Extract metadata
-            metadata_parser = MetadataParser()
-            doc_metadata = metadata_parser.parse(processed_text)
+            doc_metadata = self._metadata_parser.parse(processed_text)
 
-            # Analyze images if any were found and option is enabled
+            # Analyze images if any were found (images is empty unless option is enabled)
             image_descriptions = ""
-            if images and options.get("analyze_images", False):
+            if images:
                 try:
-                    analyzer = ImageAnalyzer()
-                    analyzed_images = analyzer.describe_images_batch(
+                    analyzed_images = self._get_analyzer().describe_images_batch(
                         images, context="documento judicial brasileiro"
                     )
 
                     # Format image descriptions
-                    image_descriptions = "\n\n## 📸 Imagens Anexadas\n\n"
+                    image_parts = ["\n\n## 📸 Imagens Anexadas\n\n"]
                     for idx, img_data in enumerate(analyzed_images, 1):
-                        image_descriptions += format_image_description_markdown(img_data, idx)
+                        image_parts.append(format_image_description_markdown(img_data, idx))
+                    image_descriptions = "".join(image_parts)
 
                 except ValueError:
                     # API key not configured - skip image analysis
@@ -250,12 +499,10 @@ class API:
                     image_descriptions = f"\n\n## ⚠️ Erro na Análise de Imagens\n\n{str(e)}\n\n"
 
             # Format output
-            formatter = MarkdownFormatter()
-
             if options.get("structured", False):
-                output_text = formatter.format_with_sections(processed_text, doc_metadata)
+                output_text = self._formatter.format_with_sections(processed_text, doc_metadata)
             else:
-                output_text = formatter.format(
+                output_text = self._formatter.format(
                     processed_text,
                     doc_metadata,
                     include_metadata_header=options.get("metadata", True),
@@ -270,6 +517,7 @@ class API:
 
             # Store last output path for export functions
             self.last_output_path = str(output_path)
+            _save_last_output_path(self.last_output_path)
 
             # Move to processed
             processado_dir = pdf_path.parent / "processado"
@@ -318,73 +566,100 @@ class API:
             output_dir.mkdir(parents=True, exist_ok=True)
 
             # Find all PDFs
-            pdf_files = list(input_dir.glob("*.pdf"))
+            pdf_files = _list_pdfs(input_dir)
 
             if not pdf_files:
                 raise Exception(f"Nenhum arquivo PDF encontrado em: {input_dir}")
 
-            # Process each PDF
+            # Create processado once instead of once per moved file
+            processado_dir = input_dir / "processado"
+            processado_dir.mkdir(parents=True, exist_ok=True)
+
+            # Process PDFs in parallel worker processes
             success_count = 0
             error_count = 0
-            errors = []
+            # Bounded: only the most recent errors are shown, the rest are counted
+            errors = collections.deque(maxlen=MAX_DETAILED_ITEMS)
+
+            worker = functools.partial(
+                _process_one_pdf,
+                options=options,
+                output_dir=output_dir,
+                processado_dir=processado_dir,
+            )
+            max_workers = min(os.cpu_count() or 1, 4)
 
-            for pdf_path in pdf_files:
-                try:
-                    # Extract text
-                    with PyMuPDFExtractor(pdf_path) as extractor:
-                        raw_text = extractor.extract_text()
-
-                    # Process text
-                    if options.get("normalize", True):
-                        normalizer = TextNormalizer()
-                        processed_text = normalizer.normalize(raw_text)
-                        processed_text = normalizer.remove_page_markers(processed_text)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for success, pdf_path, error in executor.map(worker, pdf_files, chunksize=1):
+                    if success:
+                        success_count += 1
                     else:
-                        processed_text = raw_text
-
-                    # Extract metadata
-                    metadata_parser = MetadataParser()
-                    doc_metadata = metadata_parser.parse(processed_text)
-
-                    # Format output
-                    formatter = MarkdownFormatter()
-                    output_text = formatter.format(
-                        processed_text,
-                        doc_metadata,
-                        include_metadata_header=options.get("metadata", True),
-                    )
-
-                    # Save to file
-                    output_path = output_dir / pdf_path.with_suffix(".md").name
-                    MarkdownFormatter.save_to_file(output_text, str(output_path))
-
-                    # Move processed PDF
-                    processado_dir = input_dir / "processado"
-                    new_pdf_path = processado_dir / pdf_path.name
-
-                    if not safe_move_file(pdf_path, new_pdf_path):
-                        logger.warning(f"Could not move {pdf_path.name}, but extraction succeeded")
-
-                    success_count += 1
-
-                except Exception as e:
-                    error_count += 1
-                    errors.append(f"{pdf_path.name}: {str(e)}")
+                        error_count += 1
+                        errors.append(f"{pdf_path.name}: {error}")
 
             # Summary
             message = "✅ Concluído!\n"
             message += f"   Sucesso: {success_count} arquivo(s)\n"
             if error_count > 0:
                 message += f"   Erros: {error_count} arquivo(s)\n"
-                message += "\nDetalhes dos erros:\n" + "\n".join(errors[:5])
-                if len(errors) > 5:
-                    message += f"\n... e mais {len(errors) - 5} erro(s)"
+                message += "\nDetalhes dos erros:\n" + "\n".join(errors)
+                if error_count > len(errors):
+                    message += f"\n... e mais {error_count - len(errors)} erro(s)"
 
             return message
 
         except Exception as e:
             raise Exception(f"Erro no processamento em lote: {str(e)}") from e
 
+    def _scan_process_number(self, pdf_path):
+        """Find the process number of a PDF from its first pages.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            tuple: (pdf_path, proc_num); proc_num is "UNKNOWN" when no number is
+            found and None when the PDF can't be read
+        """
+        try:
+            with PyMuPDFExtractor(pdf_path) as extractor:
+                head_text = extractor.extract_first_pages_text()
+        except Exception:
+            return pdf_path, None
+
+        # Get process number
+        proc_num = RegexPatterns.extract_process_number(head_text)
+        if not proc_num:
+            # Try to extract from filename
+            proc_num = RegexPatterns.extract_process_number(pdf_path.name) or "UNKNOWN"
+
+        return pdf_path, proc_num
+
+    def _extract_for_merge(self, pdf_path, normalizer):
+        """Fully extract a PDF that is part of a merge group.
+
+        Args:
+            pdf_path: Path to PDF file
+            normalizer: TextNormalizer to apply, or None to keep raw text
+
+        Returns:
+            tuple: (pdf_path, processed_text, doc_metadata)
+        """
+        with PyMuPDFExtractor(pdf_path) as extractor:
+            raw_text = extractor.extract_text()
+
+        # Normalize if enabled
+        if normalizer:
+            processed_text = normalizer.normalize(raw_text)
+            processed_text = normalizer.remove_page_markers(processed_text)
+        else:
+            processed_text = raw_text
+
+        # Extract metadata
+        doc_metadata = self._metadata_parser.parse(processed_text)
+
+        return pdf_path, processed_text, doc_metadata
+
     def merge_process(self, input_dir, options):
         """Merge multiple PDFs of the same process.
 
@@ -397,53 +672,30 @@ class API:
         """
         try:
             input_dir = Path(input_dir)
-            import re
 
-            # Find all PDFs recursively
-            pdf_files = sorted(input_dir.rglob("*.pdf"))
-
-            # Exclude PDFs in processado folder
-            pdf_files = [f for f in pdf_files if "processado" not in f.parts]
+            # Find all PDFs recursively (processado folders are pruned during the walk)
+            pdf_files = sorted(_walk_pdfs(input_dir))
 
             if not pdf_files:
                 raise Exception(f"Nenhum arquivo PDF encontrado em: {input_dir}")
 
-            # Group PDFs by process number
-            metadata_parser = MetadataParser()
-            normalizer = TextNormalizer() if options.get("normalize", True) else None
+            metadata_parser = self._metadata_parser
+            normalizer = self._normalizer if options.get("normalize", True) else None
+
+            # Phase 1: group PDFs by process number, scanning only the first pages
             process_groups = {}
 
+            # Sequential on purpose: PyMuPDF must not be used from several threads
             for pdf_path in pdf_files:
-                try:
-                    # Extract text
-                    with PyMuPDFExtractor(pdf_path) as extractor:
-                        raw_text = extractor.extract_text()
-
-                    # Normalize if enabled
-                    if normalizer:
-                        processed_text = normalizer.normalize(raw_text)
-                        processed_text = normalizer.remove_page_markers(processed_text)
-                    else:
-                        processed_text = raw_text
-
-                    # Extract metadata
-                    doc_metadata = metadata_parser.parse(processed_text)
+                pdf_path, proc_num = self._scan_process_number(pdf_path)
+                if proc_num is None:
+                    continue  # Unreadable PDF
 
-                    # Get process number
-                    proc_num = doc_metadata.process_number
-                    if not proc_num:
-                        # Try to extract from filename
-                        match = re.search(r"\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}", pdf_path.name)
-                        proc_num = match.group(0) if match else "UNKNOWN"
+                # Group by process number
+                if proc_num not in process_groups:
+                    process_groups[proc_num] = []
 
-                    # Group by process number
-                    if proc_num not in process_groups:
-                        process_groups[proc_num] = []
-
-                    process_groups[proc_num].append((pdf_path, processed_text, doc_metadata))
-
-                except Exception:
-                    continue
+                process_groups[proc_num].append(pdf_path)
 
             # Filter by process number if specified
             process_number = options.get("process_number")
@@ -455,53 +707,64 @@ class API:
 
             # Process each group
             files_created = []
-            for proc_num, files in process_groups.items():
-                if len(files) == 1 and not process_number:
+            processado_dir = input_dir / "processado"
+            created_dirs = set()  # processado subfolders already created
+            for proc_num, group_files in process_groups.items():
+                if len(group_files) == 1 and not process_number:
                     continue  # Skip single-file processes
 
-                # Build merged content
-                combined_sections = []
+                # Phase 2: full extraction only for PDFs that will be merged
+                _prefetch_files(group_files)
+                files = []
+                for pdf_path in group_files:
+                    try:
+                        files.append(self._extract_for_merge(pdf_path, normalizer))
+                    except Exception:
+                        continue
+
+                if not files:
+                    continue
+
+                # Build merged content as a list of chunks (written in order, never joined)
+                chunks = [
+                    f"# Processo {proc_num} - Consolidado\n\n",
+                    f"*Mesclado a partir de {len(files)} arquivo(s) PDF*\n\n",
+                    "---\n\n",
+                ]
 
                 for i, (pdf_path, text, metadata) in enumerate(files, 1):
-                    section_parts = []
+                    if i > 1:
+                        chunks.append("\n\n---\n\n")
 
                     # Document separator
-                    section_parts.append(f"## Documento {i}: {pdf_path.name}")
+                    chunks.append(f"## Documento {i}: {pdf_path.name}\n")
 
                     # Metadata
                     metadata_md = metadata_parser.format_metadata_as_markdown(metadata)
                     if metadata_md:
-                        section_parts.append("\n**Metadados:**\n")
-                        section_parts.append(metadata_md)
+                        chunks.append("\n**Metadados:**\n\n")
+                        chunks.append(metadata_md)
+                        chunks.append("\n")
 
                     # Content
-                    section_parts.append("\n### Conteúdo\n")
-                    section_parts.append(text)
+                    chunks.append("\n### Conteúdo\n\n")
+                    chunks.append(text)
 
-                    combined_sections.append("\n".join(section_parts))
-
-                # Build final document
+                # Save
                 safe_proc = proc_num.replace("/", "-")
                 output_path = input_dir / f"processo_{safe_proc}_merged.md"
-
-                final_content = f"# Processo {proc_num} - Consolidado\n\n"
-                final_content += f"*Mesclado a partir de {len(files)} arquivo(s) PDF*\n\n"
-                final_content += "---\n\n"
-                final_content += "\n\n---\n\n".join(combined_sections)
-
-                # Save
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                MarkdownFormatter.save_to_file(final_content, str(output_path))
+                MarkdownFormatter.save_to_file(chunks, output_path)
 
                 files_created.append((proc_num, len(files), output_path))
 
                 # Move processed PDFs
-                processado_dir = input_dir / "processado"
-
                 for pdf_path, _, _ in files:
                     relative_path = pdf_path.relative_to(input_dir)
                     new_pdf_path = processado_dir / relative_path
-                    safe_move_file(pdf_path, new_pdf_path)
+                    if new_pdf_path.parent not in created_dirs:
+                        new_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(new_pdf_path.parent)
+                    safe_move_file(pdf_path, new_pdf_path, skip_mkdir=True)
 
             # Summary
             if not files_created:
@@ -520,9 +783,8 @@ class API:
 
 def main():
     """Main application entry point."""
-    # Load environment variables from .env file
-    env_path = get_resource_path(".env")
-    load_dotenv(env_path)
+    # Imported here so worker processes and non-GUI imports skip the GUI stack
+    import webview
 
     # Create API instance
     api = API()
@@ -572,4 +834,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for ProcessPoolExecutor workers in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     main()
@@ -6,8 +6,12 @@ Gera executável Windows (.exe) usando PyInstaller com tratamento
 robusto de erros e limpeza automática de arquivos bloqueados.
 """
 
+import functools
+import os
+import shutil
 import subprocess
 import sys
+import zipfile
 from pathlib import Path
 
 # Import build utilities
@@ -19,20 +23,89 @@ except ImportError:
     HAS_BUILD_UTILS = False
     print("⚠️  build_utils.py não encontrado - usando limpeza básica")
 
+# zlib-ng (opcional): deflate com SIMD, ~2x mais rápido e mesmo formato do zlib
+try:
+    from zlib_ng import zlib_ng
+
+    zipfile.zlib = zlib_ng
+except ImportError:
+    pass
+
 
 def check_requirements():
     """Verifica se PyInstaller está instalado."""
     import importlib.util
 
-    try:
-        if importlib.util.find_spec("PyInstaller") is not None:
-            print("✅ PyInstaller encontrado")
-        return True
-    except ImportError:
+    # find_spec só localiza o pacote, sem executá-lo (import real fica para o build)
+    if importlib.util.find_spec("PyInstaller") is None:
         print("❌ PyInstaller não encontrado")
         print("   Instale com: pip install pyinstaller")
         return False
 
+    print("✅ PyInstaller encontrado")
+    return True
+
+
+# Hidden imports (dependências que PyInstaller pode não detectar).
+# Submódulos já puxam o pacote pai (PIL.Image -> PIL); "PyMuPDF" é só o nome da
+# distribuição, o módulo importável é fitz.
+_HIDDEN_IMPORTS = (
+    "fitz",
+    "webview",
+    "click",
+    "tqdm",
+    "PIL.Image",
+    "google.generativeai",
+    "google.ai.generativelanguage",
+)
+
+# Módulos pesados que o aplicativo não usa (PyInstaller os inclui por dependência transitiva)
+_EXCLUDES = (
+    "tkinter",
+    "matplotlib",
+    "notebook",
+    "IPython",
+    "pytest",
+    "PIL.ImageQt",
+    "PyQt5",
+    "PyQt6",
+    "numpy.tests",
+    "scipy",
+    # Stdlib que nenhum módulo empacotado importa (conferido no warn-*.txt do build).
+    # unittest fica: pyparsing (via httplib2/Gemini) o importa ao carregar;
+    # distutils/setuptools ficam: cffi os importa
+    "test",
+    "pydoc",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _base_pyinstaller_args() -> tuple[str, ...]:
+    """Monta (uma vez) as opções do PyInstaller comuns às versões debug e release."""
+    # Separador de path (Windows usa ; Linux/macOS usa :)
+    separator = ";" if sys.platform == "win32" else ":"
+
+    args = [
+        "--onedir",  # Pasta com executável + dependências (sem auto-extração ao iniciar)
+        "--debug=noarchive",  # Módulos .pyc soltos no disco, sem descompactar arquivo PYZ
+        f"--add-data=assets{separator}assets",  # Incluir assets
+        f"--add-data=src{separator}src",  # Incluir src
+        "--clean",  # Limpar cache antes do build
+    ]
+
+    # UPX só quando pedido (PDF2MD_UPX=1): a compressão deixa o build e a
+    # inicialização mais lentos e costuma gerar falsos positivos em antivírus
+    upx_path = shutil.which("upx") if os.environ.get("PDF2MD_UPX") else None
+    if upx_path:
+        args.append(f"--upx-dir={Path(upx_path).parent}")
+    else:
+        args.append("--noupx")
+
+    args.extend(f"--hidden-import={imp}" for imp in _HIDDEN_IMPORTS)
+    args.extend(f"--exclude-module={mod}" for mod in _EXCLUDES)
+
+    return tuple(args)
+
 
 def build_executable(debug_mode: bool = False):
     """Constrói o executável com PyInstaller.
@@ -54,18 +127,8 @@ def build_executable(debug_mode: bool = False):
         print("   O executável será criado sem ícone personalizado")
         print("   Veja assets/ICON_CREATION.md para criar um ícone\n")
 
-    # Separador de path (Windows usa ; Linux/macOS usa :)
-    separator = ";" if sys.platform == "win32" else ":"
-
-    # Comando PyInstaller
-    cmd = [
-        "pyinstaller",
-        "--onefile",  # Gerar único executável
-        f"--name={exe_name}",  # Nome do executável
-        f"--add-data=assets{separator}assets",  # Incluir assets
-        f"--add-data=src{separator}src",  # Incluir src
-        "--clean",  # Limpar cache antes do build
-    ]
+    # Comando PyInstaller (opções comuns às duas versões vêm do cache)
+    cmd = ["pyinstaller", f"--name={exe_name}", *_base_pyinstaller_args()]
 
     # Adicionar --windowed apenas para versão release (sem console)
     if not debug_mode:
@@ -74,29 +137,14 @@ def build_executable(debug_mode: bool = False):
     if icon_arg and not debug_mode:
         cmd.append(icon_arg)
 
-    # Hidden imports (dependências que PyInstaller pode não detectar)
-    hidden_imports = [
-        "fitz",
-        "PyMuPDF",
-        "webview",
-        "click",
-        "tqdm",
-        "PIL",
-        "PIL.Image",
-        "google.generativeai",
-        "google.ai",
-        "google.ai.generativelanguage",
-    ]
-
-    for imp in hidden_imports:
-        cmd.append(f"--hidden-import={imp}")
-
     # Entry point
     cmd.append("app_ui.py")
 
     # Executar PyInstaller
     print(f"Comando: {' '.join(cmd)}\n")
 
+    # Cada build roda em um processo próprio: o PyInstaller guarda estado global
+    # (CONF, caches de hooks) entre execuções no mesmo interpretador
     try:
         subprocess.run(cmd, check=True, capture_output=False)
         return True
@@ -108,49 +156,13 @@ def build_executable(debug_mode: bool = False):
         return False
 
 
-def create_portable_package():
-    """Cria pacote portável (opcional)."""
-    import shutil
-
-    print("\n📦 Criando pacote portável...")
-
-    dist_dir = Path("dist")
-    package_dir = dist_dir / "PDF2MD_Portable"
-
-    # Determinar nome do executável
-    exe_name = "PDF2MD.exe" if sys.platform == "win32" else "PDF2MD"
-    exe_path = dist_dir / exe_name
-
-    if not exe_path.exists():
-        print("   ⚠️  Executável não encontrado - pulando criação de pacote")
-        return False
-
-    try:
-        # Remover pacote antigo se existir
-        if package_dir.exists():
-            shutil.rmtree(package_dir)
-
-        package_dir.mkdir(parents=True)
-
-        # Copiar executável
-        shutil.copy(exe_path, package_dir)
-        print(f"   ✓ Copiado: {exe_name}")
-
-        # Copiar README
-        if Path("README.md").exists():
-            shutil.copy("README.md", package_dir)
-            print("   ✓ Copiado: README.md")
-
-        # Criar README de instalação
-        install_readme = package_dir / "LEIA-ME.txt"
-        install_readme.write_text(
-            """
+PORTABLE_README = """
 PDF Legal Extractor - Versão Portável
 ====================================
 
 INSTALAÇÃO:
 1. Extraia todos os arquivos para uma pasta no seu computador
-2. Execute PDF2MD.exe
+2. Execute PDF2MD\\PDF2MD.exe (mantenha os demais arquivos da pasta junto)
 3. Crie um atalho no desktop se desejar
 
 REQUISITOS:
@@ -176,14 +188,46 @@ https://github.com/fbmoulin/pdftotext
 
 Versão: 1.0
 Criado por: Lex Intelligentia
-""",
-            encoding="utf-8",
-        )
-        print("   ✓ Criado: LEIA-ME.txt")
+"""
+
+
+def create_portable_package():
+    """Cria pacote portável (opcional)."""
+    print("\n📦 Criando pacote portável...")
+
+    dist_dir = Path("dist")
+    zip_path = dist_dir / "PDF2MD_Portable.zip"
 
-        # Criar arquivo zip
+    # Determinar nome do executável (build --onedir: dist/PDF2MD/PDF2MD.exe)
+    app_dir = dist_dir / "PDF2MD"
+    exe_name = "PDF2MD.exe" if sys.platform == "win32" else "PDF2MD"
+    exe_path = app_dir / exe_name
+
+    if not exe_path.exists():
+        print("   ⚠️  Executável não encontrado - pulando criação de pacote")
+        return False
+
+    try:
+        # Escrever o ZIP direto dos arquivos de origem (sem pasta intermediária).
+        # Binários do PyInstaller quase não comprimem: nível 1 poupa CPU sem perder tamanho.
         print("   Criando PDF2MD_Portable.zip...")
-        shutil.make_archive(str(dist_dir / "PDF2MD_Portable"), "zip", package_dir)
+        with zipfile.ZipFile(
+            zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
+            # Pasta do aplicativo (executável + dependências)
+            for file_path in sorted(app_dir.rglob("*")):
+                if file_path.is_file():
+                    zf.write(file_path, Path("PDF2MD") / file_path.relative_to(app_dir))
+            print(f"   ✓ Adicionado: PDF2MD/{exe_name}")
+
+            # README
+            if Path("README.md").exists():
+                zf.write("README.md", "README.md", compresslevel=6)
+                print("   ✓ Adicionado: README.md")
+
+            # README de instalação
+            zf.writestr("LEIA-ME.txt", PORTABLE_README, compresslevel=6)
+            print("   ✓ Adicionado: LEIA-ME.txt")
 
         print("✅ Pacote portável criado: dist/PDF2MD_Portable.zip")
         return True
@@ -201,33 +245,33 @@ def print_next_steps():
     print("=" * 60)
     print("\n📦 EXECUTÁVEIS CRIADOS:")
     if sys.platform == "win32":
-        print("   1. PDF2MD_debug.exe  - Com console (para ver erros)")
-        print("   2. PDF2MD.exe        - Sem console (versão final)")
+        print("   1. PDF2MD_debug\\PDF2MD_debug.exe  - Com console (para ver erros)")
+        print("   2. PDF2MD\\PDF2MD.exe              - Sem console (versão final)")
     else:
-        print("   1. PDF2MD_debug      - Com console (para ver erros)")
-        print("   2. PDF2MD            - Sem console (versão final)")
+        print("   1. PDF2MD_debug/PDF2MD_debug      - Com console (para ver erros)")
+        print("   2. PDF2MD/PDF2MD                  - Sem console (versão final)")
 
     print("\nPRÓXIMOS PASSOS:")
     print("\n1. Teste primeiro a versão DEBUG:")
     if sys.platform == "win32":
-        print("   > .\\dist\\PDF2MD_debug.exe")
+        print("   > .\\dist\\PDF2MD_debug\\PDF2MD_debug.exe")
         print("   (Se der erro, você verá no console)")
     else:
-        print("   > ./dist/PDF2MD_debug")
+        print("   > ./dist/PDF2MD_debug/PDF2MD_debug")
 
     print("\n2. Se funcionar, use a versão RELEASE:")
     if sys.platform == "win32":
-        print("   > .\\dist\\PDF2MD.exe")
+        print("   > .\\dist\\PDF2MD\\PDF2MD.exe")
     else:
-        print("   > ./dist/PDF2MD")
+        print("   > ./dist/PDF2MD/PDF2MD")
 
     print("\n3. Para criar instalador Windows:")
     print("   > Abra installer.iss no Inno Setup Compiler")
     print("   > Clique em 'Compile' (F9)")
 
     print("\n4. Distribua:")
-    print("   - Executável: dist/PDF2MD.exe (stand-alone)")
-    print("   - Debug: dist/PDF2MD_debug.exe (para troubleshooting)")
+    print("   - Aplicativo: dist/PDF2MD/ (pasta com PDF2MD.exe e dependências)")
+    print("   - Debug: dist/PDF2MD_debug/ (para troubleshooting)")
     print("   - Portável: dist/PDF2MD_Portable.zip")
     print("   - Instalador: Output/PDF2MD_Setup.exe (após Inno Setup)")
     print("\n" + "=" * 60)
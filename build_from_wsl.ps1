@@ -106,8 +106,8 @@ Write-Host ""
 Write-Host "[3/3] Verificando resultado..." -ForegroundColor Yellow
 Write-Host ""
 
-$debugExe = "dist\PDF2MD_debug.exe"
-$releaseExe = "dist\PDF2MD.exe"
+$debugExe = "dist\PDF2MD_debug\PDF2MD_debug.exe"
+$releaseExe = "dist\PDF2MD\PDF2MD.exe"
 
 if (Test-Path $debugExe) {
     $debugSize = (Get-Item $debugExe).Length / 1MB
@@ -138,13 +138,13 @@ Write-Host ""
 Write-Host "PROXIMOS PASSOS:" -ForegroundColor Yellow
 Write-Host ""
 Write-Host "1. Testar versao DEBUG:" -ForegroundColor White
-Write-Host "   .\dist\PDF2MD_debug.exe" -ForegroundColor Cyan
+Write-Host "   .\dist\PDF2MD_debug\PDF2MD_debug.exe" -ForegroundColor Cyan
 Write-Host ""
 Write-Host "   Deve abrir SEM erro de recursao" -ForegroundColor Gray
 Write-Host "   Deve abrir SEM mensagem 'Modo Demonstracao'" -ForegroundColor Gray
 Write-Host ""
 Write-Host "2. Se funcionar, usar versao RELEASE:" -ForegroundColor White
-Write-Host "   .\dist\PDF2MD.exe" -ForegroundColor Cyan
+Write-Host "   .\dist\PDF2MD\PDF2MD.exe" -ForegroundColor Cyan
 Write-Host ""
 
 # Opcao de abrir automaticamente
@@ -161,7 +161,7 @@ if (-not $SkipTest) {
         Write-Host "  - Botao 'Extrair PDF' funciona" -ForegroundColor Gray
         Write-Host ""
 
-        Start-Process ".\dist\PDF2MD_debug.exe"
+        Start-Process ".\dist\PDF2MD_debug\PDF2MD_debug.exe"
     }
 }
 
@@ -9,13 +9,120 @@ import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Per-item progress output (BUILD_VERBOSE=1); by default only summaries are printed
+VERBOSE = bool(os.environ.get("BUILD_VERBOSE"))
+
+MIB = 1 << 20  # Bytes per MiB (sizes are reported in binary units)
+
+
+def _win32_kernel32():
+    """Load kernel32 with the signatures used by the process/file helpers."""
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    kernel32.CreateFileW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        ctypes.c_void_p,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.HANDLE,
+    ]
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    return kernel32
+
+
+def _win32_terminate_processes(process_name, timeout_ms=5000):
+    """
+    Terminate processes by image name and wait for them to exit (Windows).
+
+    Enumerates processes with a Toolhelp snapshot and waits on each process
+    handle, so no taskkill.exe is spawned and no fixed sleep is needed.
+
+    Args:
+        process_name: Image name to match, case-insensitive (e.g., 'PDF2MD.exe')
+        timeout_ms: Maximum time to wait for each process to exit
+
+    Returns:
+        int: Number of processes terminated
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    PROCESS_TERMINATE = 0x0001
+    SYNCHRONIZE = 0x00100000
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    kernel32 = _win32_kernel32()
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    pids = []
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == process_name.lower():
+                pids.append(entry.th32ProcessID)
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+    terminated = 0
+    for pid in pids:
+        handle = kernel32.OpenProcess(PROCESS_TERMINATE | SYNCHRONIZE, False, pid)
+        if not handle:
+            continue
+        try:
+            if kernel32.TerminateProcess(handle, 1):
+                kernel32.WaitForSingleObject(handle, timeout_ms)
+                terminated += 1
+        finally:
+            kernel32.CloseHandle(handle)
+
+    return terminated
+
 
 def kill_process_by_name(process_name):
     """
     Kill all processes matching the given name (Windows).
 
+    Waits until the processes have actually exited, so their file locks are
+    released when this returns.
+
     Args:
         process_name: Name of process to kill (e.g., 'PDF2MD.exe')
 
@@ -26,60 +133,147 @@ def kill_process_by_name(process_name):
         return True
 
     try:
-        # Use taskkill on Windows
-        result = subprocess.run(
-            ["taskkill", "/F", "/IM", process_name], capture_output=True, text=True
-        )
-
-        if result.returncode == 0:
+        if _win32_terminate_processes(process_name):
             print(f"   ✓ Processo {process_name} encerrado")
-            return True
-        elif "not found" in result.stderr.lower() or "não encontrado" in result.stderr.lower():
-            # Process not running - that's fine
-            return True
-        else:
-            print(f"   ⚠️  Aviso ao encerrar {process_name}: {result.stderr.strip()}")
-            return True
+        return True
     except Exception as e:
         print(f"   ⚠️  Erro ao encerrar processo: {e}")
         return False
 
 
-def wait_for_file_release(file_path, max_attempts=5, delay=1):
+def _is_file_locked(file_path):
+    """
+    Check whether a file is held open by another process.
+
+    On Windows, opens the file with no sharing via CreateFileW, which fails
+    immediately with a sharing violation instead of raising through Python's
+    open(). Elsewhere, falls back to opening the file for append.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        bool: True if the file is locked
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        GENERIC_READ = 0x80000000
+        GENERIC_WRITE = 0x40000000
+        OPEN_EXISTING = 3
+        FILE_ATTRIBUTE_NORMAL = 0x80
+        ERROR_ACCESS_DENIED = 5
+        ERROR_SHARING_VIOLATION = 32
+        INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+        kernel32 = _win32_kernel32()
+        handle = kernel32.CreateFileW(
+            file_path,
+            GENERIC_READ | GENERIC_WRITE,
+            0,
+            None,
+            OPEN_EXISTING,
+            FILE_ATTRIBUTE_NORMAL,
+            None,
+        )
+        if handle == INVALID_HANDLE_VALUE:
+            return ctypes.get_last_error() in (ERROR_ACCESS_DENIED, ERROR_SHARING_VIOLATION)
+        kernel32.CloseHandle(handle)
+        return False
+
+    try:
+        with open(file_path, "a"):
+            pass
+        return False
+    except PermissionError:
+        return True
+    except Exception:
+        return False
+
+
+def wait_for_file_release(file_path, timeout=3.0, max_delay=1.0):
     """
     Wait for a file to be released (not locked).
 
+    Retries with exponential backoff (10ms, 20ms, 40ms, ...) so an already
+    released file costs a single check.
+
     Args:
         file_path: Path to file
-        max_attempts: Maximum number of attempts
-        delay: Delay between attempts in seconds
+        timeout: Maximum total time to wait in seconds
+        max_delay: Upper bound for a single backoff step in seconds
 
     Returns:
         bool: True if file is accessible or doesn't exist
     """
-    file_path = Path(file_path)
+    file_path = os.fspath(file_path)
 
-    if not file_path.exists():
+    if not os.path.exists(file_path):
         return True
 
-    for attempt in range(max_attempts):
-        try:
-            # Try to open file exclusively
-            with open(file_path, "a"):
-                pass
-            return True
-        except PermissionError:
-            if attempt < max_attempts - 1:
-                print(
-                    f"   ⏳ Aguardando liberação de {file_path.name}... ({attempt + 1}/{max_attempts})"
-                )
-                time.sleep(delay)
-            else:
-                return False
-        except Exception:
-            return True
+    deadline = time.monotonic() + timeout
+    delay = 0.01
 
-    return False
+    while _is_file_locked(file_path):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if delay == 0.01:
+            print(f"   ⏳ Aguardando liberação de {os.path.basename(file_path)}...")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+    return True
+
+
+def _chmod_retry(func, path, exc_info):
+    """
+    shutil.rmtree error handler: clear the read-only flag and retry once.
+
+    Only the entry that failed is touched (rmtree already removes bottom-up),
+    instead of re-walking the whole tree. On Windows the read-only attribute
+    is cleared directly with SetFileAttributesW, which is all os.chmod can
+    change there anyway.
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        FILE_ATTRIBUTE_NORMAL = 0x80
+        ctypes.windll.kernel32.SetFileAttributesW(os.fspath(path), FILE_ATTRIBUTE_NORMAL)
+    else:
+        os.chmod(path, 0o777)
+    func(path)
+
+
+def _fast_rmtree(path):
+    """
+    Remove a directory tree using the OS's native command.
+
+    Uses `rd /s /q` on Windows and `rm -rf` on POSIX, which avoid
+    Python's per-entry overhead on large PyInstaller build trees. Falls back
+    to shutil.rmtree (clearing read-only files) if the native command is
+    unavailable or leaves the tree behind.
+
+    Args:
+        path: Path to directory
+
+    Raises:
+        OSError: If the directory could not be removed
+    """
+    path = os.fspath(path)
+
+    if sys.platform == "win32":
+        cmd = ["cmd", "/c", "rd", "/s", "/q", path]
+    else:
+        rm = shutil.which("rm")
+        cmd = [rm, "-rf", "--", path] if rm else None
+
+    if cmd:
+        subprocess.run(cmd, capture_output=True, check=False)
+        if not os.path.exists(path):
+            return
+
+    shutil.rmtree(path, onerror=_chmod_retry)
 
 
 def safe_remove_tree(path, max_attempts=5):
@@ -93,29 +287,19 @@ def safe_remove_tree(path, max_attempts=5):
     Returns:
         bool: True if successful
     """
-    path = Path(path)
+    path = os.fspath(path)
 
-    if not path.exists():
+    if not os.path.exists(path):
         return True
 
     for attempt in range(max_attempts):
         try:
-            shutil.rmtree(path)
+            _fast_rmtree(path)
             return True
         except PermissionError as e:
             if attempt < max_attempts - 1:
                 print(f"   ⏳ Tentando remover {path}... ({attempt + 1}/{max_attempts})")
                 time.sleep(1)
-
-                # Try to change permissions
-                try:
-                    for root, dirs, files in os.walk(path):
-                        for d in dirs:
-                            os.chmod(os.path.join(root, d), 0o777)
-                        for f in files:
-                            os.chmod(os.path.join(root, f), 0o777)
-                except Exception:
-                    pass
             else:
                 print(f"   ⚠️  Não foi possível remover {path}: {e}")
                 return False
@@ -126,6 +310,36 @@ def safe_remove_tree(path, max_attempts=5):
     return False
 
 
+# Directories never scanned for __pycache__ (environments, VCS, build output)
+_PYCACHE_SKIP_DIRS = {"build", "dist", "venv", "venv_build", "node_modules"}
+
+
+def _find_pycache_dirs(root):
+    """
+    Find every __pycache__ directory under root.
+
+    Does not descend into the __pycache__ directories themselves, hidden
+    directories (.git, .venv, ...) or virtual environments, so the walk stays
+    small.
+
+    Args:
+        root: Directory to scan
+
+    Returns:
+        list: Paths of __pycache__ directories
+    """
+    found = []
+    for current, dirs, _files in os.walk(root):
+        if "__pycache__" in dirs:
+            found.append(os.path.join(current, "__pycache__"))
+        dirs[:] = [
+            d
+            for d in dirs
+            if d != "__pycache__" and d not in _PYCACHE_SKIP_DIRS and not d.startswith(".")
+        ]
+    return found
+
+
 def pre_build_cleanup():
     """
     Comprehensive pre-build cleanup for Windows.
@@ -141,33 +355,60 @@ def pre_build_cleanup():
     # 1. Kill any running PDF2MD processes
     print("   [1/3] Encerrando processos...")
     kill_process_by_name("PDF2MD.exe")
-    time.sleep(1)
 
     # 2. Wait for files to be released
     print("   [2/3] Aguardando liberação de arquivos...")
-    dist_exe = Path("dist/PDF2MD.exe")
+    dist_exe = Path("dist/PDF2MD/PDF2MD.exe")
     if dist_exe.exists():
-        if not wait_for_file_release(dist_exe, max_attempts=3):
+        if not wait_for_file_release(dist_exe, timeout=3.0):
             print("   ⚠️  Arquivo ainda bloqueado - continuando mesmo assim...")
             success = False
 
     # 3. Remove build directories
     print("   [3/3] Removendo diretórios de build...")
 
-    dirs_to_clean = ["build", "dist", "__pycache__"]
-    for dir_name in dirs_to_clean:
-        if Path(dir_name).exists():
-            print(f"      Removendo {dir_name}/")
-            if not safe_remove_tree(dir_name, max_attempts=3):
-                success = False
+    dirs_to_clean = [d for d in ("build", "dist") if os.path.exists(d)]
+    dirs_to_clean.extend(_find_pycache_dirs("."))
+    with os.scandir(".") as entries:
+        spec_files = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".spec") and entry.is_file(follow_symlinks=False)
+        ]
+
+    # Trees are independent and removal is I/O-bound: remove them concurrently
+    if dirs_to_clean or spec_files:
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(dirs_to_clean) + len(spec_files))
+        ) as executor:
+            dir_futures = []
+            for dir_name in dirs_to_clean:
+                if VERBOSE:
+                    print(f"      Removendo {dir_name}/")
+                dir_futures.append(executor.submit(safe_remove_tree, dir_name, max_attempts=3))
+            spec_futures = {
+                executor.submit(os.unlink, spec_file): spec_file for spec_file in spec_files
+            }
+
+            removed_dirs = 0
+            for future in as_completed(dir_futures):
+                if future.result():
+                    removed_dirs += 1
+                else:
+                    success = False
+
+            removed_specs = 0
+            for future in as_completed(spec_futures):
+                spec_file = spec_futures[future]
+                try:
+                    future.result()
+                    removed_specs += 1
+                    if VERBOSE:
+                        print(f"      Removendo {spec_file}")
+                except Exception as e:
+                    print(f"      ⚠️  Não foi possível remover {spec_file}: {e}")
 
-    # Remove spec files
-    for spec_file in Path(".").glob("*.spec"):
-        try:
-            spec_file.unlink()
-            print(f"      Removendo {spec_file}")
-        except Exception as e:
-            print(f"      ⚠️  Não foi possível remover {spec_file}: {e}")
+        print(f"      Removidos {removed_dirs} diretório(s) e {removed_specs} arquivo(s) .spec")
 
     if success:
         print("   ✓ Limpeza concluída\n")
@@ -178,6 +419,23 @@ def pre_build_cleanup():
     return success
 
 
+def _tree_size(path):
+    """
+    Total size in bytes of all files under a directory.
+
+    Uses os.scandir so each entry costs one stat at most (none on Windows,
+    where the size comes with the directory listing).
+    """
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _tree_size(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
 def verify_build_result():
     """
     Verify that build was successful and display results.
@@ -186,24 +444,28 @@ def verify_build_result():
         bool: True if build successful
     """
     exe_name = "PDF2MD.exe" if sys.platform == "win32" else "PDF2MD"
-    exe_path = Path("dist") / exe_name
+    exe_path = Path("dist") / "PDF2MD" / exe_name
 
-    if not exe_path.exists():
+    try:
+        os.stat(exe_path)
+    except FileNotFoundError:
         print(f"\n❌ Executável não encontrado: {exe_path}")
         return False
 
-    # Check file size
-    size_mb = exe_path.stat().st_size / (1024 * 1024)
+    # Check app folder size (--onedir build: exe + dependencies)
+    size_mib = _tree_size(exe_path.parent) / MIB
 
     print("\n✅ Build concluído com sucesso!")
     print(f"   📍 Local: {exe_path}")
-    print(f"   📦 Tamanho: {size_mb:.2f} MB")
+    print(f"   📦 Tamanho: {size_mib:.2f} MiB")
 
     # Check for portable package
     portable_zip = Path("dist/PDF2MD_Portable.zip")
-    if portable_zip.exists():
-        zip_size = portable_zip.stat().st_size / (1024 * 1024)
-        print(f"   📦 Pacote portável: {portable_zip} ({zip_size:.2f} MB)")
+    try:
+        zip_size = os.stat(portable_zip).st_size / MIB
+        print(f"   📦 Pacote portável: {portable_zip} ({zip_size:.2f} MiB)")
+    except FileNotFoundError:
+        pass
 
     return True
 
@@ -7,16 +7,46 @@ This script demonstrates how to use the library in your own Python code.
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.extractors import PyMuPDFExtractor
-from src.formatters import MarkdownFormatter
-from src.processors import MetadataParser, TextNormalizer
+if TYPE_CHECKING:
+    from src.processors.metadata_parser import DocumentMetadata
 
 
-def example_basic_extraction(pdf_path: str):
+# Library imports live inside each example so `python example.py` with a bad
+# argument exits without loading PyMuPDF and the processing modules.
+
+
+def load_document(pdf_path: str) -> tuple[int, str, str, "DocumentMetadata"]:
+    """
+    Run the full pipeline once: extract, normalize and parse metadata.
+
+    Returns:
+        tuple: (page_count, raw_text, normalized_text, metadata)
+    """
+    from src.extractors import PyMuPDFExtractor
+    from src.processors import MetadataParser, TextNormalizer
+
+    with PyMuPDFExtractor(pdf_path) as extractor:
+        page_count = extractor.get_page_count()
+        pages = list(extractor.extract_text_pages())
+
+    raw_text = "\n\n".join(pages)
+
+    # Normalize
+    normalizer = TextNormalizer()
+    text = normalizer.normalize(raw_text)
+    text = normalizer.remove_page_markers(text)
+
+    metadata = MetadataParser().parse(text)
+
+    return page_count, raw_text, text, metadata
+
+
+def example_basic_extraction(pdf_path: str, page_count: int, raw_text: str):
     """
     Example 1: Basic text extraction from PDF.
     """
@@ -24,20 +54,17 @@ def example_basic_extraction(pdf_path: str):
     print("EXAMPLE 1: Basic Text Extraction")
     print("=" * 60)
 
-    with PyMuPDFExtractor(pdf_path) as extractor:
-        # Get basic info
-        page_count = extractor.get_page_count()
-        print(f"\n📄 PDF: {Path(pdf_path).name}")
-        print(f"   Páginas: {page_count}")
+    # Basic info
+    print(f"\n📄 PDF: {Path(pdf_path).name}")
+    print(f"   Páginas: {page_count}")
 
-        # Extract text
-        text = extractor.extract_text()
-        print(f"   Caracteres extraídos: {len(text)}")
-        print("\n   Primeiros 200 caracteres:")
-        print(f"   {text[:200]}...\n")
+    # Extracted text
+    print(f"   Caracteres extraídos: {len(raw_text)}")
+    print("\n   Primeiros 200 caracteres:")
+    print(f"   {raw_text[:200]}...\n")
 
 
-def example_with_normalization(pdf_path: str):
+def example_with_normalization(raw_text: str, clean_text: str):
     """
     Example 2: Extract and normalize text.
     """
@@ -45,22 +72,12 @@ def example_with_normalization(pdf_path: str):
     print("EXAMPLE 2: Text Extraction + Normalization")
     print("=" * 60)
 
-    # Extract
-    with PyMuPDFExtractor(pdf_path) as extractor:
-        raw_text = extractor.extract_text()
-
     print(f"\n📄 Texto bruto: {len(raw_text)} caracteres")
-
-    # Normalize
-    normalizer = TextNormalizer()
-    clean_text = normalizer.normalize(raw_text)
-    clean_text = normalizer.remove_page_markers(clean_text)
-
     print(f"   Texto normalizado: {len(clean_text)} caracteres")
     print(f"   Redução: {len(raw_text) - len(clean_text)} caracteres\n")
 
 
-def example_metadata_extraction(pdf_path: str):
+def example_metadata_extraction(metadata: "DocumentMetadata"):
     """
     Example 3: Extract metadata from legal document.
     """
@@ -68,17 +85,6 @@ def example_metadata_extraction(pdf_path: str):
     print("EXAMPLE 3: Metadata Extraction")
     print("=" * 60)
 
-    # Extract and normalize text
-    with PyMuPDFExtractor(pdf_path) as extractor:
-        raw_text = extractor.extract_text()
-
-    normalizer = TextNormalizer()
-    text = normalizer.normalize(raw_text)
-
-    # Extract metadata
-    parser = MetadataParser()
-    metadata = parser.parse(text)
-
     print("\n⚖️  Metadados Jurídicos:\n")
 
     if metadata.process_number:
@@ -124,25 +130,18 @@ def example_metadata_extraction(pdf_path: str):
     print()
 
 
-def example_markdown_output(pdf_path: str, output_path: str = "example_output.md"):
+def example_markdown_output(
+    text: str, metadata: "DocumentMetadata", output_path: str = "example_output.md"
+):
     """
     Example 4: Generate structured Markdown output.
     """
+    from src.formatters import MarkdownFormatter
+
     print("=" * 60)
     print("EXAMPLE 4: Markdown Output")
     print("=" * 60)
 
-    # Full pipeline
-    with PyMuPDFExtractor(pdf_path) as extractor:
-        raw_text = extractor.extract_text()
-
-    normalizer = TextNormalizer()
-    text = normalizer.normalize(raw_text)
-    text = normalizer.remove_page_markers(text)
-
-    parser = MetadataParser()
-    metadata = parser.parse(text)
-
     # Format as Markdown
     formatter = MarkdownFormatter()
     markdown = formatter.format(text, metadata, include_metadata_header=True)
@@ -156,24 +155,16 @@ def example_markdown_output(pdf_path: str, output_path: str = "example_output.md
     print(f"\n{markdown[:500]}...\n")
 
 
-def example_rag_chunks(pdf_path: str):
+def example_rag_chunks(text: str, metadata: "DocumentMetadata"):
     """
     Example 5: Generate chunks for RAG pipeline.
     """
+    from src.formatters import MarkdownFormatter
+
     print("=" * 60)
     print("EXAMPLE 5: RAG Chunks")
     print("=" * 60)
 
-    # Full pipeline
-    with PyMuPDFExtractor(pdf_path) as extractor:
-        raw_text = extractor.extract_text()
-
-    normalizer = TextNormalizer()
-    text = normalizer.normalize(raw_text)
-
-    parser = MetadataParser()
-    metadata = parser.parse(text)
-
     # Generate chunks for RAG
     formatter = MarkdownFormatter()
     chunks = formatter.format_for_rag(text, metadata, chunk_size=1000)
@@ -209,12 +200,14 @@ def main():
     print(f"\nPDF: {pdf_path}\n")
 
     try:
-        # Run examples
-        example_basic_extraction(pdf_path)
-        example_with_normalization(pdf_path)
-        example_metadata_extraction(pdf_path)
-        example_markdown_output(pdf_path)
-        example_rag_chunks(pdf_path)
+        # Extract, normalize and parse once; every example reuses the results
+        page_count, raw_text, text, metadata = load_document(pdf_path)
+
+        example_basic_extraction(pdf_path, page_count, raw_text)
+        example_with_normalization(raw_text, text)
+        example_metadata_extraction(metadata)
+        example_markdown_output(text, metadata)
+        example_rag_chunks(text, metadata)
 
         print("=" * 60)
         print("✅ Todos os exemplos executados com sucesso!")
@@ -4,31 +4,39 @@
 Extract and structure text from Brazilian legal PDF documents (PJe format).
 """
 
+import errno
+import functools
+import os
 import shutil
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from dotenv import load_dotenv
-from tqdm import tqdm
 
-from src.lex_pdftotext.extractors import PyMuPDFExtractor, TableExtractor
-from src.lex_pdftotext.formatters import JSONFormatter, MarkdownFormatter, TableFormatter
-from src.lex_pdftotext.processors import DocumentMetadata, MetadataParser, TextNormalizer
 from src.lex_pdftotext.utils.cache import get_performance_monitor
-from src.lex_pdftotext.utils.config import get_config
+from src.lex_pdftotext.utils.config import get_config, load_env_file
 from src.lex_pdftotext.utils.constants import (
-    FILENAME_DISPLAY_LENGTH,
+    HEADER_PAGES,
     MAX_DETAILED_ITEMS,
     MAX_SUMMARY_ITEMS,
+    MOVE_THREADS,
+    OUTPUT_SUFFIXES,
 )
 from src.lex_pdftotext.utils.exceptions import InvalidPathError
 from src.lex_pdftotext.utils.logger import get_logger, setup_logger
-from src.lex_pdftotext.utils.validators import (
-    check_disk_space,
-    estimate_output_size,
-    sanitize_output_path,
-)
+from src.lex_pdftotext.utils.patterns import RegexPatterns
+
+# PyMuPDF, the processing pipeline and tqdm are imported inside the commands
+# that use them, so `--help`, `--version` and `perf-report` start fast.
+if TYPE_CHECKING:
+    from src.lex_pdftotext.formatters import JSONFormatter, MarkdownFormatter
+    from src.lex_pdftotext.processors import DocumentMetadata, MetadataParser, TextNormalizer
+
+# Load environment variables from .env file (before the configuration reads them)
+load_env_file(Path(__file__).parent / ".env")
 
 # Load configuration
 config = get_config()
@@ -37,10 +45,26 @@ config = get_config()
 setup_logger(log_level=config.log_level, log_file=config.log_file)
 logger = get_logger(__name__)
 
+# Separators between documents in merged output
+_TXT_RULE = "=" * 80
+_MD_SEPARATOR = "\n\n---\n\n"
+_TXT_SEPARATOR = f"\n\n{_TXT_RULE}\n\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pipeline() -> (
+    tuple["TextNormalizer", "MetadataParser", "MarkdownFormatter", "JSONFormatter"]
+):
+    """Return shared, stateless pipeline objects (created once per process)."""
+    from src.lex_pdftotext.formatters import JSONFormatter, MarkdownFormatter
+    from src.lex_pdftotext.processors import MetadataParser, TextNormalizer
+
+    return TextNormalizer(), MetadataParser(), MarkdownFormatter(), JSONFormatter()
+
 
 def extract_and_normalize_pdf(
     pdf_path: Path, normalize: bool = True
-) -> tuple[str, str, DocumentMetadata]:
+) -> tuple[str, str, "DocumentMetadata"]:
     """Extract and normalize text from a PDF file.
 
     Args:
@@ -50,34 +74,112 @@ def extract_and_normalize_pdf(
     Returns:
         Tuple of (raw_text, processed_text, metadata)
     """
+    from src.lex_pdftotext.extractors import PyMuPDFExtractor
+
     # Extract text
     with PyMuPDFExtractor(pdf_path) as extractor:
         raw_text = extractor.extract_text()
 
+    return (raw_text, *normalize_and_parse(raw_text, normalize))
+
+
+def normalize_and_parse(raw_text: str, normalize: bool = True) -> tuple[str, "DocumentMetadata"]:
+    """Normalize extracted text and parse its metadata.
+
+    Args:
+        raw_text: Text extracted from the PDF
+        normalize: Whether to normalize the text
+
+    Returns:
+        Tuple of (processed_text, metadata)
+    """
+    normalizer, metadata_parser, _, _ = _get_pipeline()
+
     # Normalize if enabled
     if normalize:
-        normalizer = TextNormalizer()
         processed_text = normalizer.normalize(raw_text)
         processed_text = normalizer.remove_page_markers(processed_text)
     else:
         processed_text = raw_text
 
     # Extract metadata
-    metadata_parser = MetadataParser()
     doc_metadata = metadata_parser.parse(processed_text)
 
-    return raw_text, processed_text, doc_metadata
+    return processed_text, doc_metadata
+
+
+def _format_markdown(
+    processed_text: str,
+    doc_metadata: "DocumentMetadata",
+    include_metadata: bool,
+    structured: bool,
+    indexed: bool,
+    raw_text: str,
+) -> str:
+    """Format as Markdown: plain, with structured sections, or indexed."""
+    _, _, md_formatter, _ = _get_pipeline()
+    if indexed:
+        # Extract document positions from raw text for indexed mode
+        doc_metadata.document_positions = RegexPatterns.extract_document_ids_with_positions(
+            raw_text
+        )
+        return md_formatter.format_with_index(processed_text, doc_metadata)
+    if structured:
+        return md_formatter.format_with_sections(processed_text, doc_metadata)
+    return md_formatter.format(
+        processed_text, doc_metadata, include_metadata_header=include_metadata
+    )
+
+
+def _format_json(
+    processed_text: str,
+    doc_metadata: "DocumentMetadata",
+    include_metadata: bool,
+    structured: bool,
+    indexed: bool,
+    raw_text: str,
+) -> str:
+    """Format as JSON (hierarchical when structured)."""
+    _, _, _, json_formatter = _get_pipeline()
+    return json_formatter.format_to_string(
+        processed_text,
+        doc_metadata,
+        include_metadata=include_metadata,
+        hierarchical=structured,
+        indent=2,
+    )
+
+
+def _format_txt(
+    processed_text: str,
+    doc_metadata: "DocumentMetadata",
+    include_metadata: bool,
+    structured: bool,
+    indexed: bool,
+    raw_text: str,
+) -> str | list[str]:
+    """Format as plain text, optionally preceded by the metadata block."""
+    if not include_metadata:
+        return processed_text
+    _, metadata_parser, _, _ = _get_pipeline()
+    metadata_str = metadata_parser.format_metadata_as_markdown(doc_metadata)
+    # Keep the (possibly huge) body as its own chunk instead of concatenating
+    return [metadata_str, _MD_SEPARATOR, processed_text]
+
+
+# Output format -> formatting function (unknown formats fall back to plain text)
+_FORMATTERS = {"markdown": _format_markdown, "json": _format_json, "txt": _format_txt}
 
 
 def format_output_text(
     processed_text: str,
-    doc_metadata: DocumentMetadata,
+    doc_metadata: "DocumentMetadata",
     format: str = "markdown",
     include_metadata: bool = True,
     structured: bool = False,
     indexed: bool = False,
     raw_text: str = "",
-) -> str:
+) -> str | list[str]:
     """Format processed text for output.
 
     Args:
@@ -90,71 +192,50 @@ def format_output_text(
         raw_text: Raw text for extracting document positions (required for indexed mode)
 
     Returns:
-        Formatted output text
+        Formatted output text, or for plain text with metadata a list of
+        chunks to be written in order (see MarkdownFormatter.save_to_file)
     """
-    if format == "markdown":
-        md_formatter = MarkdownFormatter()
-
-        if indexed:
-            # Extract document positions from raw text for indexed mode
-            from src.lex_pdftotext.utils.patterns import RegexPatterns
-
-            doc_metadata.document_positions = RegexPatterns.extract_document_ids_with_positions(
-                raw_text
-            )
-            return md_formatter.format_with_index(processed_text, doc_metadata)
-        elif structured:
-            return md_formatter.format_with_sections(processed_text, doc_metadata)
-        else:
-            return md_formatter.format(
-                processed_text, doc_metadata, include_metadata_header=include_metadata
-            )
-    elif format == "json":
-        # JSON output
-        json_formatter = JSONFormatter()
-        return json_formatter.format_to_string(
-            processed_text,
-            doc_metadata,
-            include_metadata=include_metadata,
-            hierarchical=structured,
-            indent=2,
-        )
-    else:
-        # Plain text output
-        if include_metadata:
-            metadata_parser = MetadataParser()
-            metadata_str = metadata_parser.format_metadata_as_markdown(doc_metadata)
-            return f"{metadata_str}\n\n---\n\n{processed_text}"
-        else:
-            return processed_text
+    formatter = _FORMATTERS.get(format, _format_txt)
+    return formatter(processed_text, doc_metadata, include_metadata, structured, indexed, raw_text)
 
 
-def safe_move_file(src: Path, dest: Path, create_backup: bool = False) -> bool:
+def safe_move_file(
+    src: Path, dest: Path, create_backup: bool = False, skip_mkdir: bool = False
+) -> bool:
     """Safely move a file with error handling.
 
     Args:
         src: Source file path
         dest: Destination file path
         create_backup: Whether to backup if destination exists
+        skip_mkdir: Skip creating the destination directory (caller already did)
 
     Returns:
         True if successful, False otherwise
     """
     try:
         # Create destination directory if needed
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        if not skip_mkdir:
+            dest.parent.mkdir(parents=True, exist_ok=True)
 
         # Handle existing destination
         if dest.exists():
             if create_backup:
                 backup_path = dest.with_suffix(dest.suffix + ".bak")
                 logger.warning(f"Destination exists, creating backup: {backup_path}")
-                shutil.copy2(str(dest), str(backup_path))
+                # Rename instead of copying: the original is replaced right after
+                os.replace(dest, backup_path)
             else:
                 logger.warning(f"Destination exists, will overwrite: {dest}")
 
-        # Perform move
-        shutil.move(str(src), str(dest))
+        # Perform move (atomic rename on the same filesystem)
+        try:
+            os.replace(src, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-device move: fall back to copy + delete
+            shutil.move(src, dest)
         logger.info(f"File moved successfully: {src} -> {dest}")
         return True
 
@@ -174,6 +255,151 @@ def safe_move_file(src: Path, dest: Path, create_backup: bool = False) -> bool:
         return False
 
 
+def _list_pdfs(directory: Path) -> tuple[list[Path], int]:
+    """List the PDF files directly inside a directory and their total size.
+
+    Uses os.scandir so only matching entries become Path objects. Sizes come
+    from the same scan (on Windows the directory listing already carries
+    them), so the disk-space check does not stat every file again.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Tuple of (PDF paths, total size in bytes)
+    """
+    pdf_files = []
+    total_bytes = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(".pdf") and entry.is_file():
+                pdf_files.append(Path(entry.path))
+                total_bytes += entry.stat().st_size
+    return pdf_files, total_bytes
+
+
+def _walk_pdfs(directory: Path) -> Iterator[Path]:
+    """Recursively yield PDF files, skipping any processado folder.
+
+    Args:
+        directory: Root directory to walk
+
+    Yields:
+        Path of each PDF found
+    """
+    for dirpath, dirnames, filenames in os.walk(directory):
+        # Prune in place so os.walk never descends into already processed files
+        if "processado" in dirnames:
+            dirnames.remove("processado")
+
+        for filename in filenames:
+            if filename.lower().endswith(".pdf"):
+                yield Path(dirpath) / filename
+
+
+def _scan_process_number(pdf_path: Path) -> tuple[Path, str | None, str | None]:
+    """Find the process number of a PDF from its first pages (runs in a worker).
+
+    Args:
+        pdf_path: PDF file to scan
+
+    Returns:
+        Tuple of (pdf_path, proc_num, error); proc_num is "UNKNOWN" when no
+        number is found, and None (with error set) when the PDF can't be read
+    """
+    from src.lex_pdftotext.extractors import PyMuPDFExtractor
+
+    try:
+        with PyMuPDFExtractor(pdf_path) as extractor:
+            head_text = extractor.extract_first_pages_text(HEADER_PAGES)
+    except Exception as e:
+        return pdf_path, None, str(e)
+
+    # Get process number
+    proc_num = RegexPatterns.extract_process_number(head_text)
+    if not proc_num:
+        # Try to extract from filename
+        proc_num = RegexPatterns.extract_process_number(pdf_path.name) or "UNKNOWN"
+
+    return pdf_path, proc_num, None
+
+
+def _extract_and_parse(
+    pdf_path: Path, normalize: bool
+) -> tuple[Path, str | None, "DocumentMetadata | None", str | None]:
+    """Extract, normalize and parse one PDF for merge (runs in a worker process).
+
+    Args:
+        pdf_path: PDF file to process
+        normalize: Whether to normalize the text
+
+    Returns:
+        Tuple of (pdf_path, processed_text, metadata, error); text and
+        metadata are None and error holds the message if extraction failed
+    """
+    try:
+        _, processed_text, doc_metadata = extract_and_normalize_pdf(pdf_path, normalize)
+        return pdf_path, processed_text, doc_metadata, None
+    except Exception as e:
+        return pdf_path, None, None, str(e)
+
+
+def _process_one(
+    pdf_path: Path,
+    output_dir: Path,
+    processado_dir: Path,
+    format: str,
+    suffix: str,
+    normalize: bool,
+    metadata: bool,
+) -> tuple[Path, bool, str | None]:
+    """Process a single PDF for the batch command (runs in a worker process).
+
+    Extracts, formats and saves the output, then moves the PDF to the
+    'processado' folder. Defined at module level so it can be pickled.
+
+    Args:
+        pdf_path: PDF file to process
+        output_dir: Directory for the output file
+        processado_dir: Directory the PDF is moved to after processing
+        format: Output format ('markdown', 'txt', or 'json')
+        suffix: Output file suffix for the format (e.g. '.md')
+        normalize: Whether to normalize the text
+        metadata: Whether to include metadata header
+
+    Returns:
+        Tuple of (pdf_path, success, message). On success the message is a
+        warning when the PDF could not be moved, else None; on failure it is
+        the error text.
+    """
+    from src.lex_pdftotext.formatters import MarkdownFormatter
+
+    try:
+        # Determine output path
+        output_path = output_dir / (pdf_path.stem + suffix)
+
+        # Extract and normalize text
+        raw_text, processed_text, doc_metadata = extract_and_normalize_pdf(pdf_path, normalize)
+
+        # Format output
+        output_text = format_output_text(
+            processed_text, doc_metadata, format=format, include_metadata=metadata
+        )
+
+        # Save to file
+        MarkdownFormatter.save_to_file(output_text, output_path)
+
+        # Move processed PDF to 'processado' folder
+        new_pdf_path = processado_dir / pdf_path.name
+        if not safe_move_file(pdf_path, new_pdf_path, skip_mkdir=True):
+            return pdf_path, True, "Arquivo processado mas não movido"
+
+        return pdf_path, True, None
+
+    except Exception as e:
+        return pdf_path, False, str(e)
+
+
 @click.group()
 @click.version_option(version="0.3.0")
 def cli():
@@ -181,17 +407,14 @@ def cli():
 
     Extract and structure text from Brazilian legal PDF documents (PJe format).
     """
-    # Load environment variables from .env file
-    env_path = Path(__file__).parent / ".env"
-    load_dotenv(env_path)
 
 
 @cli.command()
-@click.argument("pdf_path", type=click.Path(exists=True))
+@click.argument("pdf_path", type=click.Path(exists=True, path_type=Path))
 @click.option(
     "-o",
     "--output",
-    type=click.Path(),
+    type=click.Path(path_type=Path),
     help="Output file path (default: same name as PDF with .md extension)",
 )
 @click.option(
@@ -218,25 +441,29 @@ def cli():
     default=False,
     help="Generate index with document anchors and cross-references (default: False)",
 )
-def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=lambda: min(os.cpu_count() or 1, 6),
+    show_default="min(CPUs, 6)",
+    help="Number of page blocks extracted in parallel (large PDFs only)",
+)
+def extract(pdf_path, output, format, normalize, metadata, structured, indexed, workers):
     """Extract text from a single PDF file.
 
     Example:
         python main.py extract documento.pdf -o output.md
     """
-    pdf_path = Path(pdf_path)
+    from src.lex_pdftotext.extractors import PyMuPDFExtractor
+    from src.lex_pdftotext.formatters import MarkdownFormatter
+    from src.lex_pdftotext.utils.validators import sanitize_output_path
 
     # Determine output path
     if output is None:
-        if format == "markdown":
-            output = pdf_path.with_suffix(".md")
-        elif format == "json":
-            output = pdf_path.with_suffix(".json")
-        else:
-            output = pdf_path.with_suffix(".txt")
+        output = pdf_path.parent / (pdf_path.stem + OUTPUT_SUFFIXES.get(format, ".txt"))
     else:
         # Validate and sanitize user-provided output path
-        output = Path(output)
         try:
             output = sanitize_output_path(output, pdf_path.parent)
         except InvalidPathError as e:
@@ -246,14 +473,15 @@ def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
     click.echo(f"📄 Extraindo texto de: {pdf_path.name}")
 
     try:
-        # Get page count before extraction
+        # Open (and validate) the PDF once for both the page count and the text
         with PyMuPDFExtractor(pdf_path) as extractor:
             click.echo(f"   Páginas: {extractor.get_page_count()}")
+            raw_text = extractor.extract_text(workers=workers)
 
-        # Extract and normalize text
+        # Normalize text and parse metadata
         if normalize:
             click.echo("   Normalizando texto...")
-        raw_text, processed_text, doc_metadata = extract_and_normalize_pdf(pdf_path, normalize)
+        processed_text, doc_metadata = normalize_and_parse(raw_text, normalize)
 
         # Format output
         click.echo(f"   Formatando como {format.title()}...")
@@ -269,8 +497,7 @@ def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
 
         # Save to file
         click.echo(f"   Salvando em: {output}")
-        output.parent.mkdir(parents=True, exist_ok=True)
-        MarkdownFormatter.save_to_file(output_text, str(output))
+        MarkdownFormatter.save_to_file(output_text, output)
 
         click.echo(f"✅ Concluído! Arquivo salvo em: {output}")
 
@@ -302,9 +529,12 @@ def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
 
 
 @cli.command()
-@click.argument("input_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option(
-    "-o", "--output-dir", type=click.Path(), help="Output directory (default: input_dir/output)"
+    "-o",
+    "--output-dir",
+    type=click.Path(path_type=Path),
+    help="Output directory (default: input_dir/output)",
 )
 @click.option(
     "--format",
@@ -316,24 +546,32 @@ def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
 @click.option(
     "--metadata/--no-metadata", default=True, help="Include metadata header (default: True)"
 )
-def batch(input_dir, output_dir, format, normalize, metadata):
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=lambda: min(os.cpu_count() or 1, 6),
+    show_default="min(CPUs, 6)",
+    help="Number of PDFs processed in parallel",
+)
+def batch(input_dir, output_dir, format, normalize, metadata, workers):
     """Extract text from all PDFs in a directory.
 
     Example:
         python main.py batch ./data/input -o ./data/output
     """
-    input_dir = Path(input_dir)
+    from tqdm import tqdm
+
+    from src.lex_pdftotext.utils.validators import check_disk_space, estimate_output_size_from_bytes
 
     # Determine output directory
     if output_dir is None:
         output_dir = input_dir / "output"
-    else:
-        output_dir = Path(output_dir)
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Find all PDFs
-    pdf_files = list(input_dir.glob("*.pdf"))
+    pdf_files, total_bytes = _list_pdfs(input_dir)
 
     if not pdf_files:
         click.echo(f"❌ Nenhum arquivo PDF encontrado em: {input_dir}")
@@ -344,7 +582,7 @@ def batch(input_dir, output_dir, format, normalize, metadata):
 
     # Check disk space
     try:
-        total_estimated_mb = sum(estimate_output_size(pdf) for pdf in pdf_files)
+        total_estimated_mb = estimate_output_size_from_bytes(total_bytes)
         required_mb = max(total_estimated_mb, config.min_disk_space_mb)
 
         has_space, available_mb = check_disk_space(output_dir, required_mb)
@@ -370,48 +608,45 @@ def batch(input_dir, output_dir, format, normalize, metadata):
         logger.warning(f"Could not check disk space: {e}")
         click.echo(f"⚠️  Aviso: Não foi possível verificar espaço em disco: {e}", err=True)
 
-    # Process each PDF
+    # Process PDFs in parallel (extraction is CPU-bound and holds the GIL)
     success_count = 0
     error_count = 0
-
-    with tqdm(pdf_files, desc="Processando PDFs", unit="arquivo") as pbar:
-        for pdf_path in pbar:
-            pbar.set_description(f"Processando {pdf_path.name[:FILENAME_DISPLAY_LENGTH]}")
-
-            try:
-                # Determine output path
-                if format == "markdown":
-                    output_path = output_dir / pdf_path.with_suffix(".md").name
-                elif format == "json":
-                    output_path = output_dir / pdf_path.with_suffix(".json").name
-                else:
-                    output_path = output_dir / pdf_path.with_suffix(".txt").name
-
-                # Extract and normalize text
-                raw_text, processed_text, doc_metadata = extract_and_normalize_pdf(
-                    pdf_path, normalize
-                )
-
-                # Format output
-                output_text = format_output_text(
-                    processed_text, doc_metadata, format=format, include_metadata=metadata
-                )
-
-                # Save to file
-                MarkdownFormatter.save_to_file(output_text, str(output_path))
-
-                # Move processed PDF to 'processado' folder
-                processado_dir = input_dir / "processado"
-                new_pdf_path = processado_dir / pdf_path.name
-
-                if not safe_move_file(pdf_path, new_pdf_path):
-                    tqdm.write(f"⚠️  {pdf_path.name}: Arquivo processado mas não movido")
-
+    processado_dir = input_dir / "processado"
+    processado_dir.mkdir(parents=True, exist_ok=True)
+    process = functools.partial(
+        _process_one,
+        output_dir=output_dir,
+        processado_dir=processado_dir,
+        format=format,
+        suffix=OUTPUT_SUFFIXES.get(format, ".txt"),  # Same for every file in the batch
+        normalize=normalize,
+        metadata=metadata,
+    )
+    workers = min(workers, len(pdf_files))
+
+    with (
+        ProcessPoolExecutor(max_workers=workers) as executor,
+        tqdm(
+            total=len(pdf_files),
+            desc="Processando PDFs",
+            unit="arquivo",
+            mininterval=0.5,  # Redraw at most twice a second, not once per PDF
+            smoothing=0,  # Average rate over the whole run
+        ) as pbar,
+    ):
+        futures = [executor.submit(process, pdf_path) for pdf_path in pdf_files]
+
+        for future in as_completed(futures):
+            pdf_path, ok, message = future.result()
+            pbar.update(1)
+
+            if ok:
                 success_count += 1
-
-            except Exception as e:
+                if message:
+                    tqdm.write(f"⚠️  {pdf_path.name}: {message}")
+            else:
                 error_count += 1
-                tqdm.write(f"❌ Erro em {pdf_path.name}: {str(e)}")
+                tqdm.write(f"❌ Erro em {pdf_path.name}: {message}")
 
     # Summary
     click.echo("\n✅ Concluído!")
@@ -421,9 +656,12 @@ def batch(input_dir, output_dir, format, normalize, metadata):
 
 
 @cli.command()
-@click.argument("input_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option(
-    "-o", "--output", type=click.Path(), help="Output file path (auto-generated if not specified)"
+    "-o",
+    "--output",
+    type=click.Path(path_type=Path),
+    help="Output file path (auto-generated if not specified)",
 )
 @click.option("--normalize/--no-normalize", default=True, help="Normalize text (default: True)")
 @click.option(
@@ -435,7 +673,15 @@ def batch(input_dir, output_dir, format, normalize, metadata):
 @click.option(
     "--process-number", type=str, help="Merge only PDFs from this specific process number"
 )
-def merge(input_dir, output, normalize, format, process_number):
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=lambda: min(os.cpu_count() or 1, 6),
+    show_default="min(CPUs, 6)",
+    help="Number of PDFs extracted in parallel",
+)
+def merge(input_dir, output, normalize, format, process_number, workers):
     """Merge multiple PDFs of the SAME PROCESS into a single output file.
 
     Groups PDFs by process number and creates one merged file per process.
@@ -445,13 +691,11 @@ def merge(input_dir, output, normalize, format, process_number):
         python main.py merge ./data/input
         python main.py merge ./data/input --process-number 5015904-66.2025.8.08.0012
     """
-    input_dir = Path(input_dir)
-
-    # Find all PDFs recursively (including subdirectories)
-    pdf_files = sorted(input_dir.rglob("*.pdf"))
+    from src.lex_pdftotext.formatters import MarkdownFormatter
+    from src.lex_pdftotext.utils.validators import sanitize_output_path
 
-    # Exclude PDFs already in 'processado' folder
-    pdf_files = [f for f in pdf_files if "processado" not in f.parts]
+    # Find all PDFs recursively (including subdirectories, except 'processado')
+    pdf_files = sorted(_walk_pdfs(input_dir))
 
     if not pdf_files:
         click.echo(f"❌ Nenhum arquivo PDF encontrado em: {input_dir}")
@@ -461,33 +705,18 @@ def merge(input_dir, output, normalize, format, process_number):
     click.echo("🔍 Agrupando por número de processo...\n")
 
     # Group PDFs by process number
-    metadata_parser = MetadataParser()
-    process_groups = {}  # {process_number: [(pdf_path, text, metadata), ...]}
+    _, metadata_parser, _, _ = _get_pipeline()
+    process_groups: dict[str, list[Path]] = {}  # {process_number: [pdf_path, ...]}
 
-    # First pass: extract and group by process number
-    for pdf_path in pdf_files:
-        try:
-            # Extract and normalize text
-            raw_text, processed_text, doc_metadata = extract_and_normalize_pdf(pdf_path, normalize)
-
-            # Get process number
-            proc_num = doc_metadata.process_number
-            if not proc_num:
-                # Try to extract from filename
-                import re
-
-                match = re.search(r"\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}", pdf_path.name)
-                proc_num = match.group(0) if match else "UNKNOWN"
+    # First pass: scan only the first pages in parallel, group in input order
+    with ProcessPoolExecutor(max_workers=min(workers, len(pdf_files))) as executor:
+        for pdf_path, proc_num, error in executor.map(_scan_process_number, pdf_files):
+            if error is not None:
+                click.echo(f"   ⚠️  Erro ao processar {pdf_path.name}: {error}")
+                continue
 
             # Group by process number
-            if proc_num not in process_groups:
-                process_groups[proc_num] = []
-
-            process_groups[proc_num].append((pdf_path, processed_text, doc_metadata))
-
-        except Exception as e:
-            click.echo(f"   ⚠️  Erro ao processar {pdf_path.name}: {str(e)}")
-            continue
+            process_groups.setdefault(proc_num, []).append(pdf_path)
 
     # Show grouping results
     click.echo(f"📊 Encontrados {len(process_groups)} processo(s) diferente(s):\n")
@@ -505,19 +734,40 @@ def merge(input_dir, output, normalize, format, process_number):
 
     click.echo()
 
+    # Second pass: full extraction only for PDFs that will actually be merged
+    to_extract = [
+        pdf_path
+        for paths in process_groups.values()
+        if len(paths) > 1 or process_number
+        for pdf_path in paths
+    ]
+    extracted = {}  # {pdf_path: (text, metadata)}
+    if to_extract:
+        extract = functools.partial(_extract_and_parse, normalize=normalize)
+        with ProcessPoolExecutor(max_workers=min(workers, len(to_extract))) as executor:
+            for pdf_path, processed_text, doc_metadata, error in executor.map(extract, to_extract):
+                if error is not None:
+                    click.echo(f"   ⚠️  Erro ao processar {pdf_path.name}: {error}")
+                    continue
+                extracted[pdf_path] = (processed_text, doc_metadata)
+
     # Process each group
     files_created = []
-    for proc_num, files in process_groups.items():
-        if len(files) == 1 and not process_number:
+    processado_dir = input_dir / "processado"
+    created_dirs: set[Path] = set()  # 'processado' subfolders already created
+    for proc_num, paths in process_groups.items():
+        files = [(pdf_path, *extracted[pdf_path]) for pdf_path in paths if pdf_path in extracted]
+        if not process_number and (len(paths) == 1 or len(files) == 1):
             click.echo(f"⏭️  Processo {proc_num}: apenas 1 arquivo, pulando merge...")
             continue
+        if not files:
+            continue
 
         # Determine output filename
         if output:
             # Validate user-provided output path
-            output_path = Path(output)
             try:
-                output_path = sanitize_output_path(output_path, input_dir)
+                output_path = sanitize_output_path(output, input_dir)
             except InvalidPathError as e:
                 click.echo(f"❌ Erro: Caminho de saída inválido: {e}", err=True)
                 sys.exit(1)
@@ -528,58 +778,62 @@ def merge(input_dir, output, normalize, format, process_number):
 
         click.echo(f"📝 Mesclando {len(files)} arquivo(s) do processo {proc_num}...")
 
-        # Build merged content
-        combined_sections = []
+        # Build merged content as a list of chunks (written in order, never joined)
+        if format == "markdown":
+            chunks = [
+                f"# Processo {proc_num} - Consolidado\n\n",
+                f"*Mesclado a partir de {len(files)} arquivo(s) PDF*\n\n",
+                "---\n\n",
+            ]
+            separator = _MD_SEPARATOR
+        else:
+            chunks = [
+                f"PROCESSO {proc_num} - CONSOLIDADO\n\n",
+                f"Mesclado a partir de {len(files)} arquivo(s) PDF\n\n",
+                f"{_TXT_RULE}\n\n",
+            ]
+            separator = _TXT_SEPARATOR
 
         for i, (pdf_path, text, metadata) in enumerate(files, 1):
-            section_parts = []
+            if i > 1:
+                chunks.append(separator)
 
             # Document separator
-            section_parts.append(f"## Documento {i}: {pdf_path.name}")
+            chunks.append(f"## Documento {i}: {pdf_path.name}\n")
 
             # Metadata
             if format == "markdown":
                 metadata_md = metadata_parser.format_metadata_as_markdown(metadata)
                 if metadata_md:
-                    section_parts.append("\n**Metadados:**\n")
-                    section_parts.append(metadata_md)
+                    chunks.append("\n**Metadados:**\n\n")
+                    chunks.append(metadata_md)
+                    chunks.append("\n")
 
             # Content
-            section_parts.append("\n### Conteúdo\n")
-            section_parts.append(text)
-
-            combined_sections.append("\n".join(section_parts))
-
-        # Build final document
-        if format == "markdown":
-            final_content = f"# Processo {proc_num} - Consolidado\n\n"
-            final_content += f"*Mesclado a partir de {len(files)} arquivo(s) PDF*\n\n"
-            final_content += "---\n\n"
-            final_content += "\n\n---\n\n".join(combined_sections)
-        else:
-            final_content = f"PROCESSO {proc_num} - CONSOLIDADO\n\n"
-            final_content += f"Mesclado a partir de {len(files)} arquivo(s) PDF\n\n"
-            final_content += "=" * 80 + "\n\n"
-            final_content += ("\n\n" + "=" * 80 + "\n\n").join(combined_sections)
+            chunks.append("\n### Conteúdo\n\n")
+            chunks.append(text)
 
         # Save
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        MarkdownFormatter.save_to_file(final_content, str(output_path))
+        MarkdownFormatter.save_to_file(chunks, output_path)
 
         click.echo(f"   ✅ Salvo em: {output_path}")
         files_created.append(output_path)
 
         # Move processed PDFs to 'processado' folder
-        processado_dir = input_dir / "processado"
-        moved_count = 0
-
-        for pdf_path, _, _ in files:
+        sources = [pdf_path for pdf_path, _, _ in files]
+        destinations = []
+        for pdf_path in sources:
             # Preserve subdirectory structure
-            relative_path = pdf_path.relative_to(input_dir)
-            new_pdf_path = processado_dir / relative_path
+            new_pdf_path = processado_dir / pdf_path.relative_to(input_dir)
+            if new_pdf_path.parent not in created_dirs:
+                new_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(new_pdf_path.parent)
+            destinations.append(new_pdf_path)
 
-            if safe_move_file(pdf_path, new_pdf_path):
-                moved_count += 1
+        # Renames are syscall-bound (slow on network shares), so overlap them in threads
+        move = functools.partial(safe_move_file, skip_mkdir=True)
+        with ThreadPoolExecutor(max_workers=min(MOVE_THREADS, len(sources))) as move_pool:
+            moved_count = sum(move_pool.map(move, sources, destinations))
 
         if moved_count > 0:
             click.echo(f"   📦 {moved_count} PDF(s) movido(s) para: {processado_dir}")
@@ -593,14 +847,24 @@ def merge(input_dir, output, normalize, format, process_number):
 
 
 @cli.command()
-@click.argument("pdf_path", type=click.Path(exists=True))
-def info(pdf_path):
+@click.argument("pdf_path", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--deep",
+    is_flag=True,
+    help=f"Parse the whole document instead of the first {HEADER_PAGES} pages "
+    "(complete document IDs, lawyers and signatures)",
+)
+def info(pdf_path, deep):
     """Show metadata information about a PDF without extracting full text.
 
+    By default only the first pages are parsed, which is where PJe documents
+    carry the process header.
+
     Example:
         python main.py info documento.pdf
+        python main.py info documento.pdf --deep
     """
-    pdf_path = Path(pdf_path)
+    from src.lex_pdftotext.extractors import PyMuPDFExtractor
 
     click.echo(f"📄 Analisando: {pdf_path.name}\n")
 
@@ -608,11 +872,14 @@ def info(pdf_path):
         # Extract text
         with PyMuPDFExtractor(pdf_path) as extractor:
             pdf_metadata = extractor.get_metadata()
-            raw_text = extractor.extract_text()
+            if deep:
+                raw_text = extractor.extract_text()
+            else:
+                raw_text = extractor.extract_first_pages_text(HEADER_PAGES)
 
         # Parse legal metadata
-        metadata_parser = MetadataParser()
-        doc_metadata = metadata_parser.parse(raw_text)
+        _, metadata_parser, _, _ = _get_pipeline()
+        doc_metadata = metadata_parser.parse_header(raw_text)
 
         # Display PDF metadata
         click.echo("📋 Metadados do PDF:")
@@ -625,7 +892,13 @@ def info(pdf_path):
             click.echo(f"   Criado em: {pdf_metadata['creation_date']}")
 
         # Display legal metadata
-        click.echo("\n⚖️  Metadados Jurídicos:")
+        if deep or pdf_metadata["page_count"] <= HEADER_PAGES:
+            click.echo("\n⚖️  Metadados Jurídicos:")
+        else:
+            click.echo(
+                f"\n⚖️  Metadados Jurídicos (primeiras {HEADER_PAGES} páginas; "
+                "use --deep para o documento inteiro):"
+            )
         if doc_metadata.process_number:
             click.echo(f"   Processo: {doc_metadata.process_number}")
         if doc_metadata.court:
@@ -709,11 +982,11 @@ def perf_report(reset, output_json):
 
 
 @cli.command()
-@click.argument("pdf_path", type=click.Path(exists=True))
+@click.argument("pdf_path", type=click.Path(exists=True, path_type=Path))
 @click.option(
     "-o",
     "--output",
-    type=click.Path(),
+    type=click.Path(path_type=Path),
     help="Output file path (default: same name as PDF with _tables.md extension)",
 )
 @click.option(
@@ -737,7 +1010,8 @@ def extract_tables(pdf_path, output, format, include_metadata):
         python main.py extract-tables documento.pdf
         python main.py extract-tables documento.pdf --format csv -o tables_dir/
     """
-    pdf_path = Path(pdf_path)
+    from src.lex_pdftotext.extractors import TableExtractor
+    from src.lex_pdftotext.formatters import MarkdownFormatter, TableFormatter
 
     click.echo(f"📊 Extraindo tabelas de: {pdf_path.name}")
 
@@ -759,7 +1033,7 @@ def extract_tables(pdf_path, output, format, include_metadata):
             if output is None:
                 output_dir = pdf_path.parent / f"{pdf_path.stem}_tables"
             else:
-                output_dir = Path(output)
+                output_dir = output
 
             click.echo(f"   Salvando CSVs em: {output_dir}")
             csv_files = extractor.extract_tables_as_csv(output_dir)
@@ -771,9 +1045,7 @@ def extract_tables(pdf_path, output, format, include_metadata):
         else:  # markdown
             # Determine output path
             if output is None:
-                output = pdf_path.with_name(f"{pdf_path.stem}_tables.md")
-            else:
-                output = Path(output)
+                output = pdf_path.parent / (pdf_path.stem + "_tables.md")
 
             # Format tables as Markdown
             click.echo("   Formatando como Markdown...")
@@ -784,12 +1056,10 @@ def extract_tables(pdf_path, output, format, include_metadata):
             header = f"# Tabelas Extraídas - {pdf_path.name}\n\n"
             header += f"**Total de tabelas:** {len(tables)}\n\n"
             header += "---\n\n"
-            markdown_output = header + markdown_output
 
-            # Save to file
+            # Save to file (header and tables written in turn, not concatenated)
             click.echo(f"   Salvando em: {output}")
-            output.parent.mkdir(parents=True, exist_ok=True)
-            MarkdownFormatter.save_to_file(markdown_output, str(output))
+            MarkdownFormatter.save_to_file([header, markdown_output], output)
 
             click.echo(f"\n✅ Concluído! Tabelas salvas em: {output}")
 
@@ -2,6 +2,7 @@
 """MCP Server for PDF Legal Extractor - Brazilian legal document processing."""
 
 import asyncio
+import functools
 import json
 import sys
 from pathlib import Path
@@ -110,6 +111,51 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=f"Ferramenta desconhecida: {name}")]
 
 
+@functools.lru_cache(maxsize=8)
+def _extract_pages_cached(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Extract the text of each non-empty page (cached per file version)."""
+    with PyMuPDFExtractor(path) as extractor:
+        return tuple(extractor.extract_text_pages())
+
+
+def _extract_pages(path: Path) -> tuple[str, ...]:
+    """Extract the text of each non-empty page, reusing earlier extractions.
+
+    Clients often call several tools on the same PDF; mtime and size are part
+    of the cache key, so a modified file is extracted again.
+    """
+    stat = path.stat()
+    return _extract_pages_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def _process_pdf(path: Path, indexed: bool, include_metadata: bool, normalize: bool):
+    """Extract, normalize and parse a PDF (blocking; run via asyncio.to_thread).
+
+    Returns:
+        tuple: (text, metadata or None), or None if the PDF has no extractable text
+    """
+    pages = _extract_pages(path)
+    if not pages:
+        return None
+
+    raw_text = "\n\n".join(pages)
+
+    # Normalize text if requested
+    text = raw_text
+    if normalize:
+        text = TextNormalizer().normalize(raw_text)
+
+    # Parse metadata from the raw text (document positions come from the raw
+    # text, before normalization)
+    metadata = None
+    if include_metadata:
+        metadata = MetadataParser().parse(raw_text)
+        if not indexed:
+            metadata.document_positions = []
+
+    return text, metadata
+
+
 async def extract_legal_pdf(
     pdf_path: str,
     indexed: bool = True,
@@ -125,30 +171,15 @@ async def extract_legal_pdf(
         if not path.suffix.lower() == ".pdf":
             return [TextContent(type="text", text=f"❌ Arquivo não é PDF: {pdf_path}")]
 
-        # Extract text
-        extractor = PyMuPDFExtractor()
-        raw_text = extractor.extract(str(path))
+        # Extract, normalize and parse off the event loop (all blocking work)
+        result = await asyncio.to_thread(
+            _process_pdf, path, indexed, include_metadata, normalize
+        )
 
-        if not raw_text or not raw_text.strip():
+        if result is None:
             return [TextContent(type="text", text="❌ PDF não contém texto extraível (pode ser escaneado)")]
 
-        # Extract document positions from raw text before normalization
-        document_positions = []
-        if indexed:
-            document_positions = RegexPatterns.extract_document_ids_with_positions(raw_text)
-
-        # Normalize text if requested
-        text = raw_text
-        if normalize:
-            normalizer = TextNormalizer()
-            text = normalizer.normalize(raw_text)
-
-        # Parse metadata
-        metadata = None
-        if include_metadata:
-            parser = MetadataParser()
-            metadata = parser.parse(raw_text)  # Use raw text for metadata extraction
-            metadata.document_positions = document_positions
+        text, metadata = result
 
         # Format output
         formatter = MarkdownFormatter()
@@ -173,8 +204,7 @@ async def extract_metadata_only(pdf_path: str) -> list[TextContent]:
         if not path.exists():
             return [TextContent(type="text", text=f"❌ Arquivo não encontrado: {pdf_path}")]
 
-        extractor = PyMuPDFExtractor()
-        raw_text = extractor.extract(str(path))
+        raw_text = "\n\n".join(await asyncio.to_thread(_extract_pages, path))
 
         if not raw_text:
             return [TextContent(type="text", text="❌ PDF não contém texto extraível")]
@@ -228,8 +258,7 @@ async def list_document_ids(pdf_path: str) -> list[TextContent]:
         if not path.exists():
             return [TextContent(type="text", text=f"❌ Arquivo não encontrado: {pdf_path}")]
 
-        extractor = PyMuPDFExtractor()
-        raw_text = extractor.extract(str(path))
+        raw_text = "\n\n".join(await asyncio.to_thread(_extract_pages, path))
 
         if not raw_text:
             return [TextContent(type="text", text="❌ PDF não contém texto extraível")]
@@ -6,24 +6,54 @@ This module provides backward compatibility for existing code that imports from
 New code should import from 'lex_pdftotext.*' directly.
 """
 
-# Re-export submodules for backward compatibility
-from .lex_pdftotext import extractors
-from .lex_pdftotext import formatters
-from .lex_pdftotext import processors
-from .lex_pdftotext import utils
-
-# Re-export main classes
-from .lex_pdftotext import (
-    __version__,
-    PyMuPDFExtractor,
-    TextNormalizer,
-    MetadataParser,
-    MarkdownFormatter,
-    JSONFormatter,
-    TableFormatter,
-    extract_pdf,
-    extract_metadata,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+from .lex_pdftotext import __version__
+
+if TYPE_CHECKING:
+    from .lex_pdftotext import (
+        JSONFormatter,
+        MarkdownFormatter,
+        MetadataParser,
+        PyMuPDFExtractor,
+        TableFormatter,
+        TextNormalizer,
+        extract_metadata,
+        extract_pdf,
+        extractors,
+        formatters,
+        processors,
+        utils,
+    )
+
+# Submodules and classes are re-exported lazily so that importing a light module
+# (e.g. src.utils.constants) does not load PyMuPDF.
+_SUBMODULES = {"extractors", "formatters", "processors", "utils"}
+_LAZY_EXPORTS = {
+    "PyMuPDFExtractor",
+    "TextNormalizer",
+    "MetadataParser",
+    "MarkdownFormatter",
+    "JSONFormatter",
+    "TableFormatter",
+    "extract_pdf",
+    "extract_metadata",
+}
+
+
+def __getattr__(name: str):
+    """Import re-exported submodules and classes on first access."""
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".lex_pdftotext.{name}", __name__)
+    elif name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(".lex_pdftotext", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "__version__",
@@ -11,11 +11,38 @@ Uso avançado:
     from lex_pdftotext.formatters import MarkdownFormatter
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 
-from .extractors import PyMuPDFExtractor
-from .formatters import JSONFormatter, MarkdownFormatter, TableFormatter
-from .processors import MetadataParser, TextNormalizer
+if TYPE_CHECKING:
+    from .extractors import PyMuPDFExtractor
+    from .formatters import JSONFormatter, MarkdownFormatter, TableFormatter
+    from .processors import MetadataParser, TextNormalizer
+
+# Classes re-exported lazily: importing the package (or a light submodule such as
+# utils.constants) must not load PyMuPDF until an extractor is actually used.
+_LAZY_EXPORTS = {
+    "PyMuPDFExtractor": ".extractors",
+    "TextNormalizer": ".processors",
+    "MetadataParser": ".processors",
+    "MarkdownFormatter": ".formatters",
+    "JSONFormatter": ".formatters",
+    "TableFormatter": ".formatters",
+}
+
+
+def __getattr__(name: str):
+    """Import re-exported classes on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Version
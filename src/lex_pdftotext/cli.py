@@ -4,28 +4,40 @@
 Extract and structure text from Brazilian legal PDF documents (PJe format).
 """
 
+import errno
+import functools
+import os
 import shutil
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from dotenv import load_dotenv
-from tqdm import tqdm
 
 from . import __version__
-from .extractors import PyMuPDFExtractor, TableExtractor
-from .formatters import JSONFormatter, MarkdownFormatter, TableFormatter
-from .processors import DocumentMetadata, MetadataParser, TextNormalizer
 from .utils.cache import get_performance_monitor
-from .utils.config import get_config
-from .utils.constants import FILENAME_DISPLAY_LENGTH, MAX_DETAILED_ITEMS, MAX_SUMMARY_ITEMS
+from .utils.config import get_config, load_env_file
+from .utils.constants import (
+    HEADER_PAGES,
+    MAX_DETAILED_ITEMS,
+    MAX_SUMMARY_ITEMS,
+    MOVE_THREADS,
+    OUTPUT_SUFFIXES,
+)
 from .utils.exceptions import InvalidPathError
 from .utils.logger import get_logger, setup_logger
-from .utils.validators import (
-    check_disk_space,
-    estimate_output_size,
-    sanitize_output_path,
-)
+from .utils.patterns import RegexPatterns
+
+# PyMuPDF, the processing pipeline and tqdm are imported inside the
+# commands that use them, so `--help`, `--version` and `perf-report` start fast.
+if TYPE_CHECKING:
+    from .formatters import JSONFormatter, MarkdownFormatter
+    from .processors import DocumentMetadata, MetadataParser, TextNormalizer
+
+# Load environment variables from .env file (before the configuration reads them)
+load_env_file(Path(__file__).parent.parent.parent / ".env")
 
 # Load configuration
 config = get_config()
@@ -34,10 +46,26 @@ config = get_config()
 setup_logger(log_level=config.log_level, log_file=config.log_file)
 logger = get_logger(__name__)
 
+# Separators between documents in merged output
+_TXT_RULE = "=" * 80
+_MD_SEPARATOR = "\n\n---\n\n"
+_TXT_SEPARATOR = f"\n\n{_TXT_RULE}\n\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pipeline() -> (
+    tuple["TextNormalizer", "MetadataParser", "MarkdownFormatter", "JSONFormatter"]
+):
+    """Return shared, stateless pipeline objects (created once per process)."""
+    from .formatters import JSONFormatter, MarkdownFormatter
+    from .processors import MetadataParser, TextNormalizer
+
+    return TextNormalizer(), MetadataParser(), MarkdownFormatter(), JSONFormatter()
+
 
 def extract_and_normalize_pdf(
     pdf_path: Path, normalize: bool = True
-) -> tuple[str, str, DocumentMetadata]:
+) -> tuple[str, str, "DocumentMetadata"]:
     """Extract and normalize text from a PDF file.
 
     Args:
@@ -47,28 +75,100 @@ def extract_and_normalize_pdf(
     Returns:
         Tuple of (raw_text, processed_text, metadata)
     """
+    from .extractors import PyMuPDFExtractor
+
     # Extract text
     with PyMuPDFExtractor(pdf_path) as extractor:
         raw_text = extractor.extract_text()
 
+    return (raw_text, *normalize_and_parse(raw_text, normalize))
+
+
+def normalize_and_parse(raw_text: str, normalize: bool = True) -> tuple[str, "DocumentMetadata"]:
+    """Normalize extracted text and parse its metadata.
+
+    Args:
+        raw_text: Text extracted from the PDF
+        normalize: Whether to normalize the text
+
+    Returns:
+        Tuple of (processed_text, metadata)
+    """
+    normalizer, metadata_parser, _, _ = _get_pipeline()
+
     # Normalize if enabled
     if normalize:
-        normalizer = TextNormalizer()
         processed_text = normalizer.normalize(raw_text)
         processed_text = normalizer.remove_page_markers(processed_text)
     else:
         processed_text = raw_text
 
     # Extract metadata
-    metadata_parser = MetadataParser()
     doc_metadata = metadata_parser.parse(processed_text)
 
-    return raw_text, processed_text, doc_metadata
+    return processed_text, doc_metadata
+
+
+def _format_markdown(
+    processed_text: str,
+    doc_metadata: "DocumentMetadata",
+    include_metadata: bool,
+    structured: bool,
+    indexed: bool,
+) -> str:
+    """Format as Markdown: plain, with structured sections, or indexed."""
+    _, _, md_formatter, _ = _get_pipeline()
+    if indexed:
+        return md_formatter.format_with_index(
+            processed_text, doc_metadata, include_metadata_header=include_metadata
+        )
+    if structured:
+        return md_formatter.format_with_sections(processed_text, doc_metadata)
+    return md_formatter.format(
+        processed_text, doc_metadata, include_metadata_header=include_metadata
+    )
+
+
+def _format_json(
+    processed_text: str,
+    doc_metadata: "DocumentMetadata",
+    include_metadata: bool,
+    structured: bool,
+    indexed: bool,
+) -> str:
+    """Format as JSON (hierarchical when structured)."""
+    _, _, _, json_formatter = _get_pipeline()
+    return json_formatter.format_to_string(
+        processed_text,
+        doc_metadata,
+        include_metadata=include_metadata,
+        hierarchical=structured,
+        indent=2,
+    )
+
+
+def _format_txt(
+    processed_text: str,
+    doc_metadata: "DocumentMetadata",
+    include_metadata: bool,
+    structured: bool,
+    indexed: bool,
+) -> str:
+    """Format as plain text, optionally preceded by the metadata block."""
+    if not include_metadata:
+        return processed_text
+    _, metadata_parser, _, _ = _get_pipeline()
+    metadata_str = metadata_parser.format_metadata_as_markdown(doc_metadata)
+    return f"{metadata_str}\n\n---\n\n{processed_text}"
+
+
+# Output format -> formatting function (unknown formats fall back to plain text)
+_FORMATTERS = {"markdown": _format_markdown, "json": _format_json, "txt": _format_txt}
 
 
 def format_output_text(
     processed_text: str,
-    doc_metadata: DocumentMetadata,
+    doc_metadata: "DocumentMetadata",
     format: str = "markdown",
     include_metadata: bool = True,
     structured: bool = False,
@@ -87,65 +187,47 @@ def format_output_text(
     Returns:
         Formatted output text
     """
-    if format == "markdown":
-        md_formatter = MarkdownFormatter()
-
-        if indexed:
-            return md_formatter.format_with_index(
-                processed_text, doc_metadata, include_metadata_header=include_metadata
-            )
-        elif structured:
-            return md_formatter.format_with_sections(processed_text, doc_metadata)
-        else:
-            return md_formatter.format(
-                processed_text, doc_metadata, include_metadata_header=include_metadata
-            )
-    elif format == "json":
-        # JSON output
-        json_formatter = JSONFormatter()
-        return json_formatter.format_to_string(
-            processed_text,
-            doc_metadata,
-            include_metadata=include_metadata,
-            hierarchical=structured,
-            indent=2,
-        )
-    else:
-        # Plain text output
-        if include_metadata:
-            metadata_parser = MetadataParser()
-            metadata_str = metadata_parser.format_metadata_as_markdown(doc_metadata)
-            return f"{metadata_str}\n\n---\n\n{processed_text}"
-        else:
-            return processed_text
+    formatter = _FORMATTERS.get(format, _format_txt)
+    return formatter(processed_text, doc_metadata, include_metadata, structured, indexed)
 
 
-def safe_move_file(src: Path, dest: Path, create_backup: bool = False) -> bool:
+def safe_move_file(
+    src: Path, dest: Path, create_backup: bool = False, skip_mkdir: bool = False
+) -> bool:
     """Safely move a file with error handling.
 
     Args:
         src: Source file path
         dest: Destination file path
         create_backup: Whether to backup if destination exists
+        skip_mkdir: Skip creating the destination directory (caller already did)
 
     Returns:
         True if successful, False otherwise
     """
     try:
         # Create destination directory if needed
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        if not skip_mkdir:
+            dest.parent.mkdir(parents=True, exist_ok=True)
 
         # Handle existing destination
         if dest.exists():
             if create_backup:
                 backup_path = dest.with_suffix(dest.suffix + ".bak")
                 logger.warning(f"Destination exists, creating backup: {backup_path}")
-                shutil.copy2(str(dest), str(backup_path))
+                # Rename instead of copying: the original is replaced right after
+                os.replace(dest, backup_path)
             else:
                 logger.warning(f"Destination exists, will overwrite: {dest}")
 
-        # Perform move
-        shutil.move(str(src), str(dest))
+        # Perform move (atomic rename on the same filesystem)
+        try:
+            os.replace(src, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-device move: fall back to copy + delete
+            shutil.move(src, dest)
         logger.info(f"File moved successfully: {src} -> {dest}")
         return True
 
@@ -165,6 +247,124 @@ def safe_move_file(src: Path, dest: Path, create_backup: bool = False) -> bool:
         return False
 
 
+def _list_pdfs(directory: Path) -> tuple[list[Path], int]:
+    """List the PDF files directly inside a directory and their total size.
+
+    Uses os.scandir so only matching entries become Path objects. Sizes come
+    from the same scan (on Windows the directory listing already carries
+    them), so the disk-space check does not stat every file again.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Tuple of (PDF paths, total size in bytes)
+    """
+    pdf_files = []
+    total_bytes = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(".pdf") and entry.is_file():
+                pdf_files.append(Path(entry.path))
+                total_bytes += entry.stat().st_size
+    return pdf_files, total_bytes
+
+
+def _walk_pdfs(directory: Path) -> Iterator[Path]:
+    """Recursively yield PDF files, skipping any processado folder.
+
+    Args:
+        directory: Root directory to walk
+
+    Yields:
+        Path of each PDF found
+    """
+    for dirpath, dirnames, filenames in os.walk(directory):
+        # Prune in place so os.walk never descends into already processed files
+        if "processado" in dirnames:
+            dirnames.remove("processado")
+
+        for filename in filenames:
+            if filename.lower().endswith(".pdf"):
+                yield Path(dirpath) / filename
+
+
+def _extract_and_parse(
+    pdf_path: Path, normalize: bool
+) -> tuple[Path, str | None, "DocumentMetadata | None", str | None]:
+    """Extract, normalize and parse one PDF for merge (runs in a worker process).
+
+    Args:
+        pdf_path: PDF file to process
+        normalize: Whether to normalize the text
+
+    Returns:
+        Tuple of (pdf_path, processed_text, metadata, error); text and
+        metadata are None and error holds the message if extraction failed
+    """
+    try:
+        _, processed_text, doc_metadata = extract_and_normalize_pdf(pdf_path, normalize)
+        return pdf_path, processed_text, doc_metadata, None
+    except Exception as e:
+        return pdf_path, None, None, str(e)
+
+
+def _process_one(
+    pdf_path: Path,
+    output_dir: Path,
+    processado_dir: Path,
+    format: str,
+    suffix: str,
+    normalize: bool,
+    metadata: bool,
+) -> tuple[Path, bool, str | None]:
+    """Process a single PDF for the batch command (runs in a worker process).
+
+    Extracts, formats and saves the output, then moves the PDF to the
+    'processado' folder. Defined at module level so it can be pickled.
+
+    Args:
+        pdf_path: PDF file to process
+        output_dir: Directory for the output file
+        processado_dir: Directory the PDF is moved to after processing
+        format: Output format ('markdown', 'txt', or 'json')
+        suffix: Output file suffix for the format (e.g. '.md')
+        normalize: Whether to normalize the text
+        metadata: Whether to include metadata header
+
+    Returns:
+        Tuple of (pdf_path, success, message). On success the message is a
+        warning when the PDF could not be moved, else None; on failure it is
+        the error text.
+    """
+    from .formatters import MarkdownFormatter
+
+    try:
+        # Determine output path
+        output_path = output_dir / (pdf_path.stem + suffix)
+
+        # Extract and normalize text
+        raw_text, processed_text, doc_metadata = extract_and_normalize_pdf(pdf_path, normalize)
+
+        # Format output
+        output_text = format_output_text(
+            processed_text, doc_metadata, format=format, include_metadata=metadata
+        )
+
+        # Save to file
+        MarkdownFormatter.save_to_file(output_text, output_path)
+
+        # Move processed PDF to 'processado' folder
+        new_pdf_path = processado_dir / pdf_path.name
+        if not safe_move_file(pdf_path, new_pdf_path, skip_mkdir=True):
+            return pdf_path, True, "File processed but not moved"
+
+        return pdf_path, True, None
+
+    except Exception as e:
+        return pdf_path, False, str(e)
+
+
 @click.group()
 @click.version_option(version=__version__)
 def cli():
@@ -172,18 +372,14 @@ def cli():
 
     Extract and structure text from Brazilian legal PDF documents (PJe format).
     """
-    # Load environment variables from .env file
-    env_path = Path(__file__).parent.parent.parent / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
 
 
 @cli.command()
-@click.argument("pdf_path", type=click.Path(exists=True))
+@click.argument("pdf_path", type=click.Path(exists=True, path_type=Path))
 @click.option(
     "-o",
     "--output",
-    type=click.Path(),
+    type=click.Path(path_type=Path),
     help="Output file path (default: same name as PDF with .md extension)",
 )
 @click.option(
@@ -210,25 +406,29 @@ def cli():
     default=False,
     help="Generate index with document anchors and cross-references (default: False)",
 )
-def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=lambda: min(os.cpu_count() or 1, 6),
+    show_default="min(CPUs, 6)",
+    help="Number of page blocks extracted in parallel (large PDFs only)",
+)
+def extract(pdf_path, output, format, normalize, metadata, structured, indexed, workers):
     """Extract text from a single PDF file.
 
     Example:
         lex-pdftotext extract documento.pdf -o output.md
     """
-    pdf_path = Path(pdf_path)
+    from .extractors import PyMuPDFExtractor
+    from .formatters import MarkdownFormatter
+    from .utils.validators import sanitize_output_path
 
     # Determine output path
     if output is None:
-        if format == "markdown":
-            output = pdf_path.with_suffix(".md")
-        elif format == "json":
-            output = pdf_path.with_suffix(".json")
-        else:
-            output = pdf_path.with_suffix(".txt")
+        output = pdf_path.parent / (pdf_path.stem + OUTPUT_SUFFIXES.get(format, ".txt"))
     else:
         # Validate and sanitize user-provided output path
-        output = Path(output)
         try:
             output = sanitize_output_path(output, pdf_path.parent)
         except InvalidPathError as e:
@@ -238,20 +438,19 @@ def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
     click.echo(f"Extracting text from: {pdf_path.name}")
 
     try:
-        # Get page count before extraction
+        # Open (and validate) the PDF once for both the page count and the text
         with PyMuPDFExtractor(pdf_path) as extractor:
             click.echo(f"   Pages: {extractor.get_page_count()}")
+            raw_text = extractor.extract_text(workers=workers)
 
-        # Extract and normalize text
+        # Normalize text and parse metadata
         if normalize:
             click.echo("   Normalizing text...")
-        raw_text, processed_text, doc_metadata = extract_and_normalize_pdf(pdf_path, normalize)
+        processed_text, doc_metadata = normalize_and_parse(raw_text, normalize)
 
         # If indexed mode, extract document positions from raw text
         # (positions are lost during normalization)
         if indexed:
-            from .utils.patterns import RegexPatterns
-
             doc_metadata.document_positions = RegexPatterns.extract_document_ids_with_positions(
                 raw_text
             )
@@ -270,7 +469,7 @@ def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
         # Save to file
         click.echo(f"   Saving to: {output}")
         output.parent.mkdir(parents=True, exist_ok=True)
-        MarkdownFormatter.save_to_file(output_text, str(output))
+        MarkdownFormatter.save_to_file(output_text, output)
 
         click.echo(f"Done! File saved to: {output}")
 
@@ -302,9 +501,12 @@ def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
 
 
 @cli.command()
-@click.argument("input_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option(
-    "-o", "--output-dir", type=click.Path(), help="Output directory (default: input_dir/output)"
+    "-o",
+    "--output-dir",
+    type=click.Path(path_type=Path),
+    help="Output directory (default: input_dir/output)",
 )
 @click.option(
     "--format",
@@ -316,24 +518,32 @@ def extract(pdf_path, output, format, normalize, metadata, structured, indexed):
 @click.option(
     "--metadata/--no-metadata", default=True, help="Include metadata header (default: True)"
 )
-def batch(input_dir, output_dir, format, normalize, metadata):
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=lambda: min(os.cpu_count() or 1, 6),
+    show_default="min(CPUs, 6)",
+    help="Number of PDFs processed in parallel",
+)
+def batch(input_dir, output_dir, format, normalize, metadata, workers):
     """Extract text from all PDFs in a directory.
 
     Example:
         lex-pdftotext batch ./data/input -o ./data/output
     """
-    input_dir = Path(input_dir)
+    from tqdm import tqdm
+
+    from .utils.validators import check_disk_space, estimate_output_size_from_bytes
 
     # Determine output directory
     if output_dir is None:
         output_dir = input_dir / "output"
-    else:
-        output_dir = Path(output_dir)
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Find all PDFs
-    pdf_files = list(input_dir.glob("*.pdf"))
+    pdf_files, total_bytes = _list_pdfs(input_dir)
 
     if not pdf_files:
         click.echo(f"No PDF files found in: {input_dir}")
@@ -344,7 +554,7 @@ def batch(input_dir, output_dir, format, normalize, metadata):
 
     # Check disk space
     try:
-        total_estimated_mb = sum(estimate_output_size(pdf) for pdf in pdf_files)
+        total_estimated_mb = estimate_output_size_from_bytes(total_bytes)
         required_mb = max(total_estimated_mb, config.min_disk_space_mb)
 
         has_space, available_mb = check_disk_space(output_dir, required_mb)
@@ -370,48 +580,45 @@ def batch(input_dir, output_dir, format, normalize, metadata):
         logger.warning(f"Could not check disk space: {e}")
         click.echo(f"Warning: Could not check disk space: {e}", err=True)
 
-    # Process each PDF
+    # Process PDFs in parallel (extraction is CPU-bound and holds the GIL)
     success_count = 0
     error_count = 0
-
-    with tqdm(pdf_files, desc="Processing PDFs", unit="file") as pbar:
-        for pdf_path in pbar:
-            pbar.set_description(f"Processing {pdf_path.name[:FILENAME_DISPLAY_LENGTH]}")
-
-            try:
-                # Determine output path
-                if format == "markdown":
-                    output_path = output_dir / pdf_path.with_suffix(".md").name
-                elif format == "json":
-                    output_path = output_dir / pdf_path.with_suffix(".json").name
-                else:
-                    output_path = output_dir / pdf_path.with_suffix(".txt").name
-
-                # Extract and normalize text
-                raw_text, processed_text, doc_metadata = extract_and_normalize_pdf(
-                    pdf_path, normalize
-                )
-
-                # Format output
-                output_text = format_output_text(
-                    processed_text, doc_metadata, format=format, include_metadata=metadata
-                )
-
-                # Save to file
-                MarkdownFormatter.save_to_file(output_text, str(output_path))
-
-                # Move processed PDF to 'processado' folder
-                processado_dir = input_dir / "processado"
-                new_pdf_path = processado_dir / pdf_path.name
-
-                if not safe_move_file(pdf_path, new_pdf_path):
-                    tqdm.write(f"Warning: {pdf_path.name}: File processed but not moved")
-
+    processado_dir = input_dir / "processado"
+    processado_dir.mkdir(parents=True, exist_ok=True)
+    process = functools.partial(
+        _process_one,
+        output_dir=output_dir,
+        processado_dir=processado_dir,
+        format=format,
+        suffix=OUTPUT_SUFFIXES.get(format, ".txt"),  # Same for every file in the batch
+        normalize=normalize,
+        metadata=metadata,
+    )
+    workers = min(workers, len(pdf_files))
+
+    with (
+        ProcessPoolExecutor(max_workers=workers) as executor,
+        tqdm(
+            total=len(pdf_files),
+            desc="Processing PDFs",
+            unit="file",
+            mininterval=0.5,  # Redraw at most twice a second, not once per PDF
+            smoothing=0,  # Average rate over the whole run
+        ) as pbar,
+    ):
+        futures = [executor.submit(process, pdf_path) for pdf_path in pdf_files]
+
+        for future in as_completed(futures):
+            pdf_path, ok, message = future.result()
+            pbar.update(1)
+
+            if ok:
                 success_count += 1
-
-            except Exception as e:
+                if message:
+                    tqdm.write(f"Warning: {pdf_path.name}: {message}")
+            else:
                 error_count += 1
-                tqdm.write(f"Error in {pdf_path.name}: {str(e)}")
+                tqdm.write(f"Error in {pdf_path.name}: {message}")
 
     # Summary
     click.echo("\nDone!")
@@ -421,9 +628,12 @@ def batch(input_dir, output_dir, format, normalize, metadata):
 
 
 @cli.command()
-@click.argument("input_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option(
-    "-o", "--output", type=click.Path(), help="Output file path (auto-generated if not specified)"
+    "-o",
+    "--output",
+    type=click.Path(path_type=Path),
+    help="Output file path (auto-generated if not specified)",
 )
 @click.option("--normalize/--no-normalize", default=True, help="Normalize text (default: True)")
 @click.option(
@@ -435,7 +645,15 @@ def batch(input_dir, output_dir, format, normalize, metadata):
 @click.option(
     "--process-number", type=str, help="Merge only PDFs from this specific process number"
 )
-def merge(input_dir, output, normalize, format, process_number):
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=lambda: min(os.cpu_count() or 1, 6),
+    show_default="min(CPUs, 6)",
+    help="Number of PDFs extracted in parallel",
+)
+def merge(input_dir, output, normalize, format, process_number, workers):
     """Merge multiple PDFs of the SAME PROCESS into a single output file.
 
     Groups PDFs by process number and creates one merged file per process.
@@ -445,13 +663,11 @@ def merge(input_dir, output, normalize, format, process_number):
         lex-pdftotext merge ./data/input
         lex-pdftotext merge ./data/input --process-number 5015904-66.2025.8.08.0012
     """
-    input_dir = Path(input_dir)
-
-    # Find all PDFs recursively (including subdirectories)
-    pdf_files = sorted(input_dir.rglob("*.pdf"))
+    from .formatters import MarkdownFormatter
+    from .utils.validators import sanitize_output_path
 
-    # Exclude PDFs already in 'processado' folder
-    pdf_files = [f for f in pdf_files if "processado" not in f.parts]
+    # Find all PDFs recursively (including subdirectories, except 'processado')
+    pdf_files = sorted(_walk_pdfs(input_dir))
 
     if not pdf_files:
         click.echo(f"No PDF files found in: {input_dir}")
@@ -461,23 +677,22 @@ def merge(input_dir, output, normalize, format, process_number):
     click.echo("Grouping by process number...\n")
 
     # Group PDFs by process number
-    metadata_parser = MetadataParser()
+    _, metadata_parser, _, _ = _get_pipeline()
     process_groups = {}  # {process_number: [(pdf_path, text, metadata), ...]}
 
-    # First pass: extract and group by process number
-    for pdf_path in pdf_files:
-        try:
-            # Extract and normalize text
-            raw_text, processed_text, doc_metadata = extract_and_normalize_pdf(pdf_path, normalize)
+    # First pass: extract in parallel, group by process number (in input order)
+    extract = functools.partial(_extract_and_parse, normalize=normalize)
+    with ProcessPoolExecutor(max_workers=min(workers, len(pdf_files))) as executor:
+        for pdf_path, processed_text, doc_metadata, error in executor.map(extract, pdf_files):
+            if error is not None:
+                click.echo(f"   Warning: Error processing {pdf_path.name}: {error}")
+                continue
 
             # Get process number
             proc_num = doc_metadata.process_number
             if not proc_num:
-                # Try to extract from filename
-                import re
-
-                match = re.search(r"\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}", pdf_path.name)
-                proc_num = match.group(0) if match else "UNKNOWN"
+                # Try to extract from filename (precompiled CNJ pattern)
+                proc_num = RegexPatterns.extract_process_number(pdf_path.name) or "UNKNOWN"
 
             # Group by process number
             if proc_num not in process_groups:
@@ -485,10 +700,6 @@ def merge(input_dir, output, normalize, format, process_number):
 
             process_groups[proc_num].append((pdf_path, processed_text, doc_metadata))
 
-        except Exception as e:
-            click.echo(f"   Warning: Error processing {pdf_path.name}: {str(e)}")
-            continue
-
     # Show grouping results
     click.echo(f"Found {len(process_groups)} different process(es):\n")
     for proc_num, files in process_groups.items():
@@ -507,6 +718,8 @@ def merge(input_dir, output, normalize, format, process_number):
 
     # Process each group
     files_created = []
+    processado_dir = input_dir / "processado"
+    created_dirs: set[Path] = set()  # 'processado' subfolders already created
     for proc_num, files in process_groups.items():
         if len(files) == 1 and not process_number:
             click.echo(f"Skipping process {proc_num}: only 1 file...")
@@ -515,9 +728,8 @@ def merge(input_dir, output, normalize, format, process_number):
         # Determine output filename
         if output:
             # Validate user-provided output path
-            output_path = Path(output)
             try:
-                output_path = sanitize_output_path(output_path, input_dir)
+                output_path = sanitize_output_path(output, input_dir)
             except InvalidPathError as e:
                 click.echo(f"Error: Invalid output path: {e}", err=True)
                 sys.exit(1)
@@ -528,58 +740,62 @@ def merge(input_dir, output, normalize, format, process_number):
 
         click.echo(f"Merging {len(files)} file(s) from process {proc_num}...")
 
-        # Build merged content
-        combined_sections = []
+        # Build merged content as a list of chunks (written in order, never joined)
+        if format == "markdown":
+            chunks = [
+                f"# Process {proc_num} - Consolidated\n\n",
+                f"*Merged from {len(files)} PDF file(s)*\n\n",
+                "---\n\n",
+            ]
+            separator = _MD_SEPARATOR
+        else:
+            chunks = [
+                f"PROCESS {proc_num} - CONSOLIDATED\n\n",
+                f"Merged from {len(files)} PDF file(s)\n\n",
+                f"{_TXT_RULE}\n\n",
+            ]
+            separator = _TXT_SEPARATOR
 
         for i, (pdf_path, text, doc_metadata) in enumerate(files, 1):
-            section_parts = []
+            if i > 1:
+                chunks.append(separator)
 
             # Document separator
-            section_parts.append(f"## Document {i}: {pdf_path.name}")
+            chunks.append(f"## Document {i}: {pdf_path.name}\n")
 
             # Metadata
             if format == "markdown":
                 metadata_md = metadata_parser.format_metadata_as_markdown(doc_metadata)
                 if metadata_md:
-                    section_parts.append("\n**Metadata:**\n")
-                    section_parts.append(metadata_md)
+                    chunks.append("\n**Metadata:**\n\n")
+                    chunks.append(metadata_md)
+                    chunks.append("\n")
 
             # Content
-            section_parts.append("\n### Content\n")
-            section_parts.append(text)
-
-            combined_sections.append("\n".join(section_parts))
-
-        # Build final document
-        if format == "markdown":
-            final_content = f"# Process {proc_num} - Consolidated\n\n"
-            final_content += f"*Merged from {len(files)} PDF file(s)*\n\n"
-            final_content += "---\n\n"
-            final_content += "\n\n---\n\n".join(combined_sections)
-        else:
-            final_content = f"PROCESS {proc_num} - CONSOLIDATED\n\n"
-            final_content += f"Merged from {len(files)} PDF file(s)\n\n"
-            final_content += "=" * 80 + "\n\n"
-            final_content += ("\n\n" + "=" * 80 + "\n\n").join(combined_sections)
+            chunks.append("\n### Content\n\n")
+            chunks.append(text)
 
         # Save
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        MarkdownFormatter.save_to_file(final_content, str(output_path))
+        MarkdownFormatter.save_to_file(chunks, output_path)
 
         click.echo(f"   Saved to: {output_path}")
         files_created.append(output_path)
 
         # Move processed PDFs to 'processado' folder
-        processado_dir = input_dir / "processado"
-        moved_count = 0
-
-        for pdf_path, _, _ in files:
+        sources = [pdf_path for pdf_path, _, _ in files]
+        destinations = []
+        for pdf_path in sources:
             # Preserve subdirectory structure
-            relative_path = pdf_path.relative_to(input_dir)
-            new_pdf_path = processado_dir / relative_path
+            new_pdf_path = processado_dir / pdf_path.relative_to(input_dir)
+            if new_pdf_path.parent not in created_dirs:
+                new_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(new_pdf_path.parent)
+            destinations.append(new_pdf_path)
 
-            if safe_move_file(pdf_path, new_pdf_path):
-                moved_count += 1
+        # Renames are syscall-bound (slow on network shares), so overlap them in threads
+        move = functools.partial(safe_move_file, skip_mkdir=True)
+        with ThreadPoolExecutor(max_workers=min(MOVE_THREADS, len(sources))) as move_pool:
+            moved_count = sum(move_pool.map(move, sources, destinations))
 
         if moved_count > 0:
             click.echo(f"   {moved_count} PDF(s) moved to: {processado_dir}")
@@ -593,14 +809,24 @@ def merge(input_dir, output, normalize, format, process_number):
 
 
 @cli.command()
-@click.argument("pdf_path", type=click.Path(exists=True))
-def info(pdf_path):
+@click.argument("pdf_path", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--deep",
+    is_flag=True,
+    help=f"Parse the whole document instead of the first {HEADER_PAGES} pages "
+    "(complete document IDs, lawyers and signatures)",
+)
+def info(pdf_path, deep):
     """Show metadata information about a PDF without extracting full text.
 
+    By default only the first pages are parsed, which is where PJe documents
+    carry the process header.
+
     Example:
         lex-pdftotext info documento.pdf
+        lex-pdftotext info documento.pdf --deep
     """
-    pdf_path = Path(pdf_path)
+    from .extractors import PyMuPDFExtractor
 
     click.echo(f"Analyzing: {pdf_path.name}\n")
 
@@ -608,11 +834,14 @@ def info(pdf_path):
         # Extract text
         with PyMuPDFExtractor(pdf_path) as extractor:
             pdf_metadata = extractor.get_metadata()
-            raw_text = extractor.extract_text()
+            if deep:
+                raw_text = extractor.extract_text()
+            else:
+                raw_text = extractor.extract_first_pages_text(HEADER_PAGES)
 
         # Parse legal metadata
-        metadata_parser = MetadataParser()
-        doc_metadata = metadata_parser.parse(raw_text)
+        _, metadata_parser, _, _ = _get_pipeline()
+        doc_metadata = metadata_parser.parse_header(raw_text)
 
         # Display PDF metadata
         click.echo("PDF Metadata:")
@@ -625,7 +854,12 @@ def info(pdf_path):
             click.echo(f"   Created: {pdf_metadata['creation_date']}")
 
         # Display legal metadata
-        click.echo("\nLegal Metadata:")
+        if deep or pdf_metadata["page_count"] <= HEADER_PAGES:
+            click.echo("\nLegal Metadata:")
+        else:
+            click.echo(
+                f"\nLegal Metadata (first {HEADER_PAGES} pages; use --deep for the whole document):"
+            )
         if doc_metadata.process_number:
             click.echo(f"   Process: {doc_metadata.process_number}")
         if doc_metadata.court:
@@ -709,11 +943,11 @@ def perf_report(reset, output_json):
 
 
 @cli.command()
-@click.argument("pdf_path", type=click.Path(exists=True))
+@click.argument("pdf_path", type=click.Path(exists=True, path_type=Path))
 @click.option(
     "-o",
     "--output",
-    type=click.Path(),
+    type=click.Path(path_type=Path),
     help="Output file path (default: same name as PDF with _tables.md extension)",
 )
 @click.option(
@@ -737,7 +971,8 @@ def extract_tables(pdf_path, output, format, include_metadata):
         lex-pdftotext extract-tables documento.pdf
         lex-pdftotext extract-tables documento.pdf --format csv -o tables_dir/
     """
-    pdf_path = Path(pdf_path)
+    from .extractors import TableExtractor
+    from .formatters import MarkdownFormatter, TableFormatter
 
     click.echo(f"Extracting tables from: {pdf_path.name}")
 
@@ -759,7 +994,7 @@ def extract_tables(pdf_path, output, format, include_metadata):
             if output is None:
                 output_dir = pdf_path.parent / f"{pdf_path.stem}_tables"
             else:
-                output_dir = Path(output)
+                output_dir = output
 
             click.echo(f"   Saving CSVs to: {output_dir}")
             csv_files = extractor.extract_tables_as_csv(output_dir)
@@ -771,9 +1006,7 @@ def extract_tables(pdf_path, output, format, include_metadata):
         else:  # markdown
             # Determine output path
             if output is None:
-                output = pdf_path.with_name(f"{pdf_path.stem}_tables.md")
-            else:
-                output = Path(output)
+                output = pdf_path.parent / (pdf_path.stem + "_tables.md")
 
             # Format tables as Markdown
             click.echo("   Formatting as Markdown...")
@@ -789,7 +1022,7 @@ def extract_tables(pdf_path, output, format, include_metadata):
             # Save to file
             click.echo(f"   Saving to: {output}")
             output.parent.mkdir(parents=True, exist_ok=True)
-            MarkdownFormatter.save_to_file(markdown_output, str(output))
+            MarkdownFormatter.save_to_file(markdown_output, output)
 
             click.echo(f"\nDone! Tables saved to: {output}")
 
@@ -1,7 +1,8 @@
 """PyMuPDF (fitz) implementation of PDF text extractor."""
 
 import io
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
 from typing import Any
@@ -11,7 +12,7 @@ from PIL import Image
 
 from ..utils.cache import get_performance_monitor
 from ..utils.config import get_config
-from ..utils.constants import PAGE_LOG_INTERVAL
+from ..utils.constants import PAGE_LOG_INTERVAL, PAGES_PER_WORKER
 from ..utils.exceptions import PDFExtractionError
 from ..utils.logger import get_logger
 from ..utils.timeout import TimeoutError
@@ -24,6 +25,65 @@ performance = get_performance_monitor()
 config = get_config()
 
 
+def _page_text_with_timeout(page: fitz.Page, page_num: int) -> str | None:
+    """
+    Extract the text of a single page with a timeout.
+
+    Args:
+        page: Page to extract
+        page_num: 0-indexed page number (for logging)
+
+    Returns:
+        str | None: Page text, or None if extraction timed out
+    """
+    # Text needs a font: pages without one (e.g. scanned images) have
+    # nothing to extract, so skip the worker thread and text pass for them
+    if not page.get_fonts():
+        return ""
+
+    # Extract text with timeout for potentially slow pages
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(page.get_text, "text")
+        try:
+            return future.result(timeout=config.page_extraction_timeout)
+        except FuturesTimeoutError:
+            logger.warning(
+                f"Page {page_num + 1} extraction timed out after {config.page_extraction_timeout}s, skipping"
+            )
+            return None
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> list[str]:
+    """
+    Extract the non-empty pages ``start`` to ``end - 1`` of a PDF.
+
+    Runs in a worker process, so it opens its own copy of the document
+    (fitz.Document objects cannot be shared across processes).
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: First page (0-indexed)
+        end: Page after the last one to extract
+
+    Returns:
+        list[str]: Text of each non-empty page in the range, in page order
+    """
+    pages = []
+    with fitz.open(pdf_path) as doc:
+        for page_num in range(start, end):
+            try:
+                text = _page_text_with_timeout(doc[page_num], page_num)
+            except Exception as e:
+                logger.error(f"Error extracting text from page {page_num + 1}: {e}")
+                continue
+
+            # Skip timed out, completely empty or whitespace-only pages
+            if text and not text.isspace():
+                pages.append(text)
+
+    return pages
+
+
 class PyMuPDFExtractor(PDFExtractor):
     """
     Fast PDF text extractor using PyMuPDF (fitz).
@@ -111,10 +171,19 @@ class PyMuPDFExtractor(PDFExtractor):
             self.doc = self._open_pdf_with_timeout()
 
     @performance.track("pdf_text_extraction")
-    def extract_text(self) -> str:
+    def extract_text(self, workers: int = 1) -> str:
         """
         Extract all text from the PDF.
 
+        With ``workers > 1``, large documents are split into contiguous blocks
+        of pages (at least PAGES_PER_WORKER each) that are extracted in
+        parallel worker processes, each opening the PDF once. Smaller
+        documents are extracted in this process. The result is the same
+        either way.
+
+        Args:
+            workers: Maximum number of parallel workers (default: 1)
+
         Returns:
             str: Complete text from all pages, separated by page breaks
 
@@ -124,40 +193,59 @@ class PyMuPDFExtractor(PDFExtractor):
         self._ensure_document_open()
         assert self.doc is not None
 
-        logger.info(f"Extracting text from {len(self.doc)} pages")
-        pages = []
+        page_count = len(self.doc)
+        workers = min(workers, page_count // PAGES_PER_WORKER)
+        if workers < 2:
+            # Join pages with simple double newline (will be cleaned later)
+            return "\n\n".join(self.extract_text_pages())
 
-        for page_num in range(len(self.doc)):
-            try:
-                page = self.doc[page_num]
+        logger.info(f"Extracting text from {page_count} pages with {workers} workers")
 
-                # Extract text with timeout for potentially slow pages
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(page.get_text, "text")
-                    try:
-                        text = future.result(timeout=config.page_extraction_timeout)
-                    except FuturesTimeoutError:
-                        logger.warning(
-                            f"Page {page_num + 1} extraction timed out after {config.page_extraction_timeout}s, skipping"
-                        )
-                        continue
-
-                # Skip completely empty or whitespace-only pages
-                if text.strip():
-                    pages.append(text)
+        # One contiguous block of pages per worker (in page order)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+
+        # Always processes: PyMuPDF must not be used from several threads at once
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            blocks = executor.map(
+                _extract_page_range, [str(self.pdf_path)] * workers, bounds[:-1], bounds[1:]
+            )
+            return "\n\n".join(text for block in blocks for text in block)
+
+    def extract_text_pages(self) -> Iterator[str]:
+        """
+        Lazily extract text one page at a time.
+
+        Only the current page is held in memory, so callers can stream
+        large documents instead of materializing the full text at once.
+        Empty pages and pages that time out or fail are skipped.
 
-                if (page_num + 1) % PAGE_LOG_INTERVAL == 0:
-                    logger.debug(f"Processed {page_num + 1}/{len(self.doc)} pages")
+        Yields:
+            str: Text of each non-empty page, in page order
+        """
+        self._ensure_document_open()
+        assert self.doc is not None
 
+        page_count = len(self.doc)
+        logger.info(f"Extracting text from {page_count} pages")
+        extracted = 0
+
+        for page_num in range(page_count):
+            try:
+                text = _page_text_with_timeout(self.doc[page_num], page_num)
             except Exception as e:
                 logger.error(f"Error extracting text from page {page_num + 1}: {e}")
                 # Continue with other pages
                 continue
 
-        logger.info(f"Text extraction completed: {len(pages)} non-empty pages")
+            if (page_num + 1) % PAGE_LOG_INTERVAL == 0:
+                logger.debug(f"Processed {page_num + 1}/{page_count} pages")
 
-        # Join pages with simple double newline (will be cleaned later)
-        return "\n\n".join(pages)
+            # Skip timed out, completely empty or whitespace-only pages
+            if text and not text.isspace():
+                extracted += 1
+                yield text
+
+        logger.info(f"Text extraction completed: {extracted} non-empty pages")
 
     def extract_text_by_page(self) -> list[str]:
         """
@@ -177,6 +265,28 @@ class PyMuPDFExtractor(PDFExtractor):
 
         return pages
 
+    def extract_first_pages_text(self, n: int = 2) -> str:
+        """
+        Extract text from the first pages only.
+
+        Cheap probe for header information (e.g. the process number, which
+        PJe documents print on the first page) without parsing the whole PDF.
+
+        Args:
+            n: Number of leading pages to read (default: 2)
+
+        Returns:
+            str: Text of the first ``n`` pages, separated by double newlines
+        """
+        self._ensure_document_open()
+        assert self.doc is not None
+
+        pages = []
+        for page_num in range(min(n, len(self.doc))):
+            pages.append(self.doc[page_num].get_text("text"))
+
+        return "\n\n".join(pages)
+
     def get_metadata(self) -> dict[str, Any]:
         """
         Extract PDF metadata.
@@ -232,23 +342,19 @@ class PyMuPDFExtractor(PDFExtractor):
             for block in text_dict.get("blocks", []):
                 if block.get("type") == 0:  # Text block
                     for line in block.get("lines", []):
-                        line_text = ""
-                        for span in line.get("spans", []):
-                            line_text += span.get("text", "")
+                        spans = line.get("spans")
+                        if not spans:
+                            continue
+                        line_text = "".join(span.get("text", "") for span in spans)
                         if line_text.strip():
                             page_text.append(line_text)
 
             pages.append("\n".join(page_text))
 
-        # Build page-separated text
-        result = "\n\n--- PÁGINA {} ---\n\n".join(
-            [f"\n\n--- PÁGINA {i + 1} ---\n\n{text}" for i, text in enumerate(pages)]
-        )
-        # Remove first page marker prefix
-        prefix = "\n\n--- PÁGINA 1 ---\n\n"
-        if result.startswith(prefix):
-            result = result[len(prefix) :]
-        return result
+        # One marker per page, built in a single join
+        return "".join(
+            f"--- PÁGINA {i + 1} ---\n\n{text}\n\n" for i, text in enumerate(pages)
+        ).rstrip()
 
     def extract_images(self) -> list[dict[str, Any]]:
         """
@@ -268,36 +374,92 @@ class PyMuPDFExtractor(PDFExtractor):
 
         images = []
         for page_num in range(len(self.doc)):
-            page = self.doc[page_num]
-            image_list = page.get_images(full=True)
-
-            for img_index, img_info in enumerate(image_list):
-                xref = img_info[0]  # Image XREF reference
-
-                try:
-                    # Extract the image
-                    base_image = self.doc.extract_image(xref)
-                    image_bytes = base_image["image"]
-
-                    # Convert to PIL Image
-                    pil_image = Image.open(io.BytesIO(image_bytes))
-
-                    # Store image info
-                    images.append(
-                        {
-                            "page_num": page_num + 1,  # 1-indexed for users
-                            "image_index": img_index,
-                            "image": pil_image,
-                            "width": pil_image.width,
-                            "height": pil_image.height,
-                            "xref": xref,
-                            "format": base_image.get("ext", "unknown"),
-                        }
-                    )
-
-                except Exception:
-                    # Skip images that can't be extracted (e.g., inline images, forms)
-                    continue
+            images.extend(self._extract_page_images(self.doc[page_num], page_num))
+
+        return images
+
+    def extract_text_and_images(self) -> tuple[str, list[dict[str, Any]]]:
+        """
+        Extract text and images in a single pass over the pages.
+
+        Equivalent to calling extract_text() and extract_images(), but each
+        page is loaded only once.
+
+        Returns:
+            tuple: (text, images) with the same formats as extract_text()
+            and extract_images()
+        """
+        self._ensure_document_open()
+        assert self.doc is not None
+
+        logger.info(f"Extracting text and images from {len(self.doc)} pages")
+        pages = []
+        images = []
+
+        for page_num in range(len(self.doc)):
+            try:
+                page = self.doc[page_num]
+            except Exception as e:
+                logger.error(f"Error loading page {page_num + 1}: {e}")
+                continue
+
+            try:
+                text = _page_text_with_timeout(page, page_num)
+                # Skip timed out, completely empty or whitespace-only pages
+                if text and not text.isspace():
+                    pages.append(text)
+            except Exception as e:
+                logger.error(f"Error extracting text from page {page_num + 1}: {e}")
+
+            images.extend(self._extract_page_images(page, page_num))
+
+        logger.info(f"Extraction completed: {len(pages)} non-empty pages, {len(images)} images")
+
+        return "\n\n".join(pages), images
+
+    def _extract_page_images(self, page: fitz.Page, page_num: int) -> list[dict[str, Any]]:
+        """
+        Extract the images of a single page.
+
+        Args:
+            page: Page to extract images from
+            page_num: 0-indexed page number
+
+        Returns:
+            list[dict]: Image dictionaries (see extract_images())
+        """
+        assert self.doc is not None
+
+        images = []
+        image_list = page.get_images(full=True)
+
+        for img_index, img_info in enumerate(image_list):
+            xref = img_info[0]  # Image XREF reference
+
+            try:
+                # Extract the image
+                base_image = self.doc.extract_image(xref)
+                image_bytes = base_image["image"]
+
+                # Convert to PIL Image
+                pil_image = Image.open(io.BytesIO(image_bytes))
+
+                # Store image info
+                images.append(
+                    {
+                        "page_num": page_num + 1,  # 1-indexed for users
+                        "image_index": img_index,
+                        "image": pil_image,
+                        "width": pil_image.width,
+                        "height": pil_image.height,
+                        "xref": xref,
+                        "format": base_image.get("ext", "unknown"),
+                    }
+                )
+
+            except Exception:
+                # Skip images that can't be extracted (e.g., inline images, forms)
+                continue
 
         return images
 
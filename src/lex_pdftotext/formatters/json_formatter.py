@@ -1,16 +1,47 @@
 """JSON formatter for legal document text."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 from ..processors.metadata_parser import DocumentMetadata, MetadataParser
 from ..utils.logger import get_logger
 
+# orjson (optional): C encoder, several times faster on large text bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Initialize logger
 logger = get_logger(__name__)
 
 
+def _dumps(data: Any, indent: int | None) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available.
+
+    orjson is only used for the default 2-space indentation, where its
+    output matches json.dumps. Its compact form drops the spaces after
+    ':' and ',', so other indents (and values orjson rejects) use the
+    standard library encoder.
+
+    Args:
+        data: JSON-serializable object
+        indent: JSON indentation (None for compact)
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. non-string keys or integers beyond 64 bits
+
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+
+
 class JSONFormatter:
     """
     Format legal document text as structured JSON.
@@ -94,7 +125,7 @@ class JSONFormatter:
             str: JSON formatted string
         """
         data = self.format(text, metadata, include_metadata, hierarchical)
-        return json.dumps(data, ensure_ascii=False, indent=indent)
+        return _dumps(data, indent).decode("utf-8")
 
     def _format_metadata(self, metadata: DocumentMetadata) -> dict[str, Any]:
         """
@@ -194,8 +225,12 @@ class JSONFormatter:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=indent)
+            content = _dumps(data, indent)
+            if os.linesep != "\n":
+                # Keep text-mode line endings, like MarkdownFormatter.save_to_file;
+                # newlines inside JSON strings are escaped, so only layout ones change
+                content = content.replace(b"\n", os.linesep.encode())
+            output_path.write_bytes(content)
 
             logger.info(f"JSON saved successfully: {output_path}")
 
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,18 @@ logger = get_logger(__name__)
 performance = get_performance_monitor()
 
 
+# Bytes accumulated before each write when saving chunked content
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _write_all(fd: int, data: bytes | bytearray) -> None:
+    """Write all of data to fd, retrying on partial writes."""
+    with memoryview(data) as view:
+        offset = 0
+        while offset < len(view):
+            offset += os.write(fd, view[offset:])
+
+
 class MarkdownFormatter:
     """
     Format legal document text as structured Markdown.
@@ -387,7 +400,7 @@ class MarkdownFormatter:
         return word_chunk, chunk_index
 
     @staticmethod
-    def save_to_file(content: str, output_path: str | Path) -> None:
+    def save_to_file(content: str | Iterable[str], output_path: str | Path) -> None:
         """
         Save formatted content to file using atomic write.
 
@@ -395,7 +408,8 @@ class MarkdownFormatter:
         This prevents file corruption if write fails midway.
 
         Args:
-            content: Markdown content
+            content: Markdown content, either one string or an iterable of
+                string chunks written in order (avoids joining large documents)
             output_path: Path to save file
 
         Raises:
@@ -412,16 +426,40 @@ class MarkdownFormatter:
             dir=output_path.parent, prefix=f".{output_path.stem}_", suffix=".tmp"
         )
 
+        chunks = [content] if isinstance(content, str) else content
+        size = 0
+
         try:
-            # Write content to temporary file
-            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-                f.write(content)
-                f.flush()
-                os.fsync(f.fileno())  # Ensure data is written to disk
+            # Encode and write bytes straight to the fd (no TextIOWrapper); small
+            # chunks are coalesced so each write(2) carries up to _WRITE_BUFFER_SIZE
+            try:
+                buffer = bytearray()
+                for chunk in chunks:
+                    size += len(chunk)
+                    if os.linesep != "\n":
+                        chunk = chunk.replace("\n", os.linesep)  # Keep text-mode line endings
+                    data = chunk.encode("utf-8")
+
+                    if len(buffer) + len(data) < _WRITE_BUFFER_SIZE:
+                        buffer += data
+                        continue
+                    if buffer:
+                        _write_all(temp_fd, buffer)
+                        buffer.clear()
+                    if len(data) >= _WRITE_BUFFER_SIZE:
+                        _write_all(temp_fd, data)
+                    else:
+                        buffer += data
+
+                if buffer:
+                    _write_all(temp_fd, buffer)
+                os.fsync(temp_fd)  # Ensure data is written to disk
+            finally:
+                os.close(temp_fd)
 
             # Atomic rename (overwrites if exists)
             os.replace(temp_path, str(output_path))
-            logger.info(f"File saved successfully: {output_path} ({len(content)} bytes)")
+            logger.info(f"File saved successfully: {output_path} ({size} bytes)")
 
         except Exception as e:
             # Clean up temp file on failure
@@ -2,6 +2,8 @@
 
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from PIL import Image
 from ratelimit import limits, sleep_and_retry
@@ -201,50 +203,69 @@ class ImageAnalyzer:
             raise  # Raise exception instead of returning error string
 
     def describe_images_batch(
-        self, images: list[dict], context: str = "legal document"
+        self, images: list[dict], context: str = "legal document", max_workers: int | None = None
     ) -> list[dict]:
         """
         Analyze multiple images in batch.
 
+        API calls run concurrently on a thread pool (they are network-bound),
+        still subject to the per-minute rate limit. Output order matches input.
+
         Args:
             images: List of image dicts (from PyMuPDFExtractor.extract_images())
             context: Document context
+            max_workers: Concurrent API calls (default: config.gemini_max_workers)
 
         Returns:
             list[dict]: Images with added 'description' field
         """
-        results = []
         total = len(images)
+        if not images:
+            return []
 
-        logger.info(f"Starting batch image analysis for {total} images")
+        workers = max(1, min(max_workers or config.gemini_max_workers, total))
+        logger.info(f"Starting batch image analysis for {total} images ({workers} workers)")
 
-        for idx, img_data in enumerate(images, 1):
-            try:
-                logger.debug(f"Processing image {idx}/{total}")
+        describe = partial(self._describe_batch_item, total=total, context=context)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(describe, range(1, total + 1), images))
 
-                description = self.describe_image(
-                    img_data["image"], context=context, page_num=img_data["page_num"]
-                )
+        logger.info(f"Batch image analysis completed: {len(results)} images processed")
+        return results
 
-                # Add description to image data
-                img_data_copy = img_data.copy()
-                img_data_copy["description"] = description
-                results.append(img_data_copy)
+    def _describe_batch_item(self, idx: int, img_data: dict, total: int, context: str) -> dict:
+        """
+        Describe one image of a batch, turning failures into an error description.
 
-            except Exception as e:
-                # Log error but continue processing other images
-                logger.warning(
-                    f"Failed to analyze image {idx}/{total} from page {img_data.get('page_num')}: "
-                    f"{type(e).__name__}: {str(e)}"
-                )
+        Args:
+            idx: 1-indexed position in the batch (for logging)
+            img_data: Image dict (from PyMuPDFExtractor.extract_images())
+            total: Batch size (for logging)
+            context: Document context
 
-                # Add error as description
-                img_data_copy = img_data.copy()
-                img_data_copy["description"] = f"[Erro: {type(e).__name__}]"
-                results.append(img_data_copy)
+        Returns:
+            dict: Copy of img_data with added 'description' field
+        """
+        img_data_copy = img_data.copy()
 
-        logger.info(f"Batch image analysis completed: {len(results)} images processed")
-        return results
+        try:
+            logger.debug(f"Processing image {idx}/{total}")
+
+            img_data_copy["description"] = self.describe_image(
+                img_data["image"], context=context, page_num=img_data["page_num"]
+            )
+
+        except Exception as e:
+            # Log error but continue processing other images
+            logger.warning(
+                f"Failed to analyze image {idx}/{total} from page {img_data.get('page_num')}: "
+                f"{type(e).__name__}: {str(e)}"
+            )
+
+            # Add error as description
+            img_data_copy["description"] = f"[Erro: {type(e).__name__}]"
+
+        return img_data_copy
 
     def _build_prompt(self, context: str, page_num: int | None = None) -> str:
         """
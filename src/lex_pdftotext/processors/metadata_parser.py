@@ -1,5 +1,6 @@
 """Metadata extraction from legal document text."""
 
+import re
 from dataclasses import dataclass, field
 
 from ..utils.cache import get_performance_monitor
@@ -8,6 +9,10 @@ from ..utils.patterns import RegexPatterns
 # Initialize performance monitor
 performance = get_performance_monitor()
 
+# Section title -> anchor ID cleanup
+_ANCHOR_INVALID_CHARS = re.compile(r"[^\w\s-]")
+_ANCHOR_WHITESPACE = re.compile(r"\s+")
+
 
 @dataclass
 class DocumentMetadata:
@@ -62,22 +67,67 @@ class MetadataParser:
         self.patterns = RegexPatterns()
 
     @performance.track("metadata_extraction")
-    def parse(self, text: str) -> DocumentMetadata:
+    def parse(self, text: str, *, document_positions: list[dict] | None = None) -> DocumentMetadata:
         """Parse text and extract all metadata.
 
         Args:
             text: Legal document text
+            document_positions: Output of
+                RegexPatterns.extract_document_ids_with_positions(text), if the
+                caller already has it; the document IDs are then not searched again
 
         Returns:
             DocumentMetadata: Structured metadata
         """
+        if document_positions is None:
+            document_positions = self._extract_document_positions(text)
+
+        # Document IDs are the IDs of the positions, in the same order
         metadata = DocumentMetadata()
+        self._parse_header_fields(
+            text, metadata, document_ids=[pos["id"] for pos in document_positions]
+        )
+
+        # Extract judges
+        metadata.judges = self._extract_judges(text)
+
+        # Extract sections
+        metadata.sections = self._extract_sections(text)
+
+        # Store positions and generate anchors
+        metadata.document_positions = document_positions
+        metadata.section_anchors = self._generate_section_anchors(metadata.sections)
+
+        return metadata
+
+    @performance.track("metadata_header_extraction")
+    def parse_header(self, text: str) -> DocumentMetadata:
+        """Parse only the summary fields found in a document's opening pages.
+
+        Skips judges, section headers, document ID positions and anchors,
+        which are only needed to format full output.
+
+        Args:
+            text: Legal document text (typically the first pages)
 
+        Returns:
+            DocumentMetadata: Metadata with the summary fields filled in
+        """
+        metadata = DocumentMetadata()
+        self._parse_header_fields(text, metadata)
+        return metadata
+
+    def _parse_header_fields(
+        self, text: str, metadata: DocumentMetadata, document_ids: list[str] | None = None
+    ) -> None:
+        """Fill process, party, court, signature and document type fields."""
         # Extract process number
         metadata.process_number = self._extract_process_number(text)
 
-        # Extract document IDs
-        metadata.document_ids = self._extract_document_ids(text)
+        # Extract document IDs (unless already known)
+        if document_ids is None:
+            document_ids = self._extract_document_ids(text)
+        metadata.document_ids = document_ids
 
         # Extract parties
         metadata.author = self._extract_author(text)
@@ -89,7 +139,6 @@ class MetadataParser:
 
         # Extract people
         metadata.lawyers = self._extract_lawyers(text)
-        metadata.judges = self._extract_judges(text)
         metadata.signature_dates = self._extract_signature_dates(text)
 
         # Detect document type
@@ -97,15 +146,6 @@ class MetadataParser:
         metadata.is_decision = self._is_decision(text)
         metadata.is_certificate = self._is_certificate(text)
 
-        # Extract sections
-        metadata.sections = self._extract_sections(text)
-
-        # Extract positions and generate anchors
-        metadata.document_positions = self._extract_document_positions(text)
-        metadata.section_anchors = self._generate_section_anchors(metadata.sections)
-
-        return metadata
-
     def _extract_process_number(self, text: str) -> str | None:
         """Extract process number in CNJ format."""
         return RegexPatterns.extract_process_number(text)
@@ -180,14 +220,12 @@ class MetadataParser:
 
     def _generate_section_anchors(self, sections: list[str]) -> dict[str, str]:
         """Generate URL-safe anchor IDs for sections."""
-        import re
-
         anchors = {}
         for section in sections:
             # Create URL-safe anchor
             anchor = section.lower()
-            anchor = re.sub(r"[^\w\s-]", "", anchor)
-            anchor = re.sub(r"\s+", "-", anchor.strip())
+            anchor = _ANCHOR_INVALID_CHARS.sub("", anchor)
+            anchor = _ANCHOR_WHITESPACE.sub("-", anchor.strip())
             anchors[section] = f"sec-{anchor}"
         return anchors
 
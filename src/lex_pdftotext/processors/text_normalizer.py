@@ -8,6 +8,33 @@ from ..utils.patterns import RegexPatterns
 # Initialize performance monitor
 performance = get_performance_monitor()
 
+# Patterns used on every line or every document, compiled once at import
+_FOOTER_PATTERN = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"\b\d{5}-?\d{3}\b",  # CEP format (12345-678 or 12345678)
+            r"\(\d{2}\)\s*\d{4,5}-?\d{4}",  # Phone numbers (11) 98765-4321
+            r"www\.",  # Websites
+            r"@\w+\.\w+",  # Email addresses
+            r"\b[Aa]v\.|[Rr]ua\s+",  # Street addresses (Av. / Rua)
+            r"\b[Ee]scritor[ií]o\s+de\s+[Aa]dvocacia\b",  # "Escritório de Advocacia"
+            r"\b[Aa]dvocacia\s+e\s+[Cc]onsultoria\b",  # "Advocacia e Consultoria"
+            r"\bOAB/[A-Z]{2}\s+\d+",  # OAB registration
+        )
+    ),
+    re.IGNORECASE,
+)
+_WHITESPACE_ONLY_LINE = re.compile(r"^\s+$", re.MULTILINE)
+_EXCESS_NEWLINES = re.compile(r"\n{3,}")
+_BLANK_LINE_RUNS = re.compile(r"\n\n+")
+_SPACE_RUNS = re.compile(r" +")
+_PAGE_FOOTER_NUM = re.compile(r"Num\.\s*\d+\s*-\s*Pág\.\s*\d+", re.IGNORECASE)
+_PAGE_PLACEHOLDER = re.compile(r"---\s*página\s*\{\}\s*---", re.IGNORECASE)
+_PAGE_MARKER = re.compile(r"\n*---\s*PÁGINA\s+\d+\s*---\n*", re.IGNORECASE)
+_SENTENCE_START = re.compile(r"([.!?]\s+)([a-z])")
+_HYPHENATED_BREAK = re.compile(r"-\s*\n\s*")
+
 
 class TextNormalizer:
     """
@@ -88,18 +115,6 @@ class TextNormalizer:
         # Identify repetitive lines (appear more than threshold times)
         repetitive_lines = {line for line, count in line_counts.items() if count >= threshold}
 
-        # Additional patterns to remove (common footer/header indicators)
-        footer_patterns = [
-            r"\b\d{5}-?\d{3}\b",  # CEP format (12345-678 or 12345678)
-            r"\(\d{2}\)\s*\d{4,5}-?\d{4}",  # Phone numbers (11) 98765-4321
-            r"www\.",  # Websites
-            r"@\w+\.\w+",  # Email addresses
-            r"\b[Aa]v\.|[Rr]ua\s+",  # Street addresses (Av. / Rua)
-            r"\b[Ee]scritor[ií]o\s+de\s+[Aa]dvocacia\b",  # "Escritório de Advocacia"
-            r"\b[Aa]dvocacia\s+e\s+[Cc]onsultoria\b",  # "Advocacia e Consultoria"
-            r"\bOAB/[A-Z]{2}\s+\d+",  # OAB registration
-        ]
-
         # Filter out repetitive lines and footer patterns
         filtered_lines = []
         for line in lines:
@@ -109,18 +124,13 @@ class TextNormalizer:
             if stripped in repetitive_lines:
                 continue
 
-            # Skip if matches footer patterns
-            is_footer = False
-            for pattern in footer_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    # Double check it's repetitive or very footer-like
-                    # Allow it if it appears only once (might be legitimate content)
-                    if line_counts.get(stripped, 0) >= 2:
-                        is_footer = True
-                        break
+            # Skip footer-like lines (address, phone, OAB...) that appear at least twice;
+            # a single occurrence might be legitimate content. The count check is
+            # cheaper than the pattern search, so it runs first.
+            if line_counts.get(stripped, 0) >= 2 and _FOOTER_PATTERN.search(line):
+                continue
 
-            if not is_footer:
-                filtered_lines.append(line)
+            filtered_lines.append(line)
 
         return "\n".join(filtered_lines)
 
@@ -131,7 +141,7 @@ class TextNormalizer:
         This is needed because PDFs often have blank pages or large whitespace areas.
         """
         # First, collapse all whitespace-only lines to truly empty lines
-        text = re.sub(r"^\s+$", "", text, flags=re.MULTILINE)
+        text = _WHITESPACE_ONLY_LINE.sub("", text)
 
         # Split into lines
         lines = text.split("\n")
@@ -155,7 +165,7 @@ class TextNormalizer:
 
         # Final pass: remove any remaining excessive blanks
         # This ensures no more than 2 newlines in a row (one blank line between paragraphs)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _EXCESS_NEWLINES.sub("\n\n", text)
 
         return text.strip()
 
@@ -165,10 +175,10 @@ class TextNormalizer:
         text = RegexPatterns.clean_noise(text)
 
         # Remove repetitive "Num. XXXXX - Pág. X" lines
-        text = re.sub(r"Num\.\s*\d+\s*-\s*Pág\.\s*\d+", "", text, flags=re.IGNORECASE)
+        text = _PAGE_FOOTER_NUM.sub("", text)
 
         # Remove standalone page markers
-        text = re.sub(r"---\s*página\s*\{\}\s*---", "", text, flags=re.IGNORECASE)
+        text = _PAGE_PLACEHOLDER.sub("", text)
 
         return text
 
@@ -229,7 +239,7 @@ class TextNormalizer:
             line = line[0].upper() + line[1:]
 
         # Capitalize after sentence-ending punctuation
-        line = re.sub(r"([.!?]\s+)([a-z])", lambda m: m.group(1) + m.group(2).upper(), line)
+        line = _SENTENCE_START.sub(lambda m: m.group(1) + m.group(2).upper(), line)
 
         # Restore acronyms (placeholders are still in the format we set)
         for placeholder, acronym in acronym_map.items():
@@ -251,7 +261,7 @@ class TextNormalizer:
         lines = [line.rstrip() for line in text.split("\n")]
 
         # Normalize spaces within lines
-        lines = [re.sub(r" +", " ", line) for line in lines]
+        lines = [_SPACE_RUNS.sub(" ", line) for line in lines]
 
         # Remove consecutive duplicate lines (keep only first occurrence)
         deduped_lines = []
@@ -276,7 +286,7 @@ class TextNormalizer:
         text = "\n".join(deduped_lines)
 
         # Reduce any excessive blank lines to single blank line
-        text = re.sub(r"\n\n+", "\n\n", text)
+        text = _BLANK_LINE_RUNS.sub("\n\n", text)
 
         # Remove leading/trailing whitespace from entire text
         text = text.strip()
@@ -293,7 +303,7 @@ class TextNormalizer:
         Returns:
             str: Text without page markers
         """
-        return re.sub(r"\n*---\s*PÁGINA\s+\d+\s*---\n*", "\n\n", text, flags=re.IGNORECASE)
+        return _PAGE_MARKER.sub("\n\n", text)
 
     def clean_line_breaks(self, text: str) -> str:
         """
@@ -302,6 +312,6 @@ class TextNormalizer:
         Example: "desenvolvi-\nmento" becomes "desenvolvimento"
         """
         # Fix hyphenated words split across lines
-        text = re.sub(r"-\s*\n\s*", "", text)
+        text = _HYPHENATED_BREAK.sub("", text)
 
         return text
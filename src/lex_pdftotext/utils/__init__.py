@@ -1,5 +1,7 @@
 """Utilities for PDF text extraction and processing."""
 
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     InvalidPathError,
     PDFCorruptedError,
@@ -9,7 +11,25 @@ from .exceptions import (
     PDFTooLargeError,
 )
 from .patterns import RegexPatterns
-from .validators import PDFValidator, sanitize_output_path
+
+if TYPE_CHECKING:
+    from .validators import PDFValidator, sanitize_output_path
+
+# validators imports PyMuPDF; load it only when one of its names is used
+_VALIDATOR_EXPORTS = {"PDFValidator", "sanitize_output_path"}
+
+
+def __getattr__(name: str):
+    """Import validator helpers on first access."""
+    if name not in _VALIDATOR_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from . import validators
+
+    value = getattr(validators, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "RegexPatterns",
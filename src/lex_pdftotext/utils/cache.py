@@ -6,6 +6,7 @@ Provides hash-based caching for expensive operations like image analysis.
 
 import hashlib
 import json
+import threading
 import time
 from collections.abc import Callable
 from functools import wraps
@@ -38,6 +39,8 @@ class ImageDescriptionCache:
         self.cache_dir = cache_dir
         self.max_entries = max_entries
         self.cache_file = self.cache_dir / "descriptions.json"
+        # Guards writes: batch image analysis calls set() from several threads
+        self._lock = threading.Lock()
 
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -135,22 +138,24 @@ class ImageDescriptionCache:
         img_hash = self._hash_image(image)
         cache_key = f"{img_hash}:{context}" if context else img_hash
 
-        # Store with timestamp
-        self._cache[cache_key] = {
-            "description": description,
-            "timestamp": time.time(),
-            "hash": img_hash,
-        }
+        with self._lock:
+            # Store with timestamp
+            self._cache[cache_key] = {
+                "description": description,
+                "timestamp": time.time(),
+                "hash": img_hash,
+            }
 
-        logger.debug(f"Cached description for image {img_hash[:8]}...")
+            logger.debug(f"Cached description for image {img_hash[:8]}...")
 
-        # Save to disk
-        self._save_cache()
+            # Save to disk
+            self._save_cache()
 
     def clear(self) -> None:
         """Clear all cached entries."""
-        self._cache = {}
-        self._save_cache()
+        with self._lock:
+            self._cache = {}
+            self._save_cache()
         logger.info("Cache cleared")
 
     def stats(self) -> dict:
@@ -52,6 +52,7 @@ class Config:
     gemini_api_key: str | None = None
     gemini_rate_limit: int = 60  # requests per minute
     gemini_api_timeout: int = 30  # API call timeout in seconds
+    gemini_max_workers: int = 8  # Concurrent API calls in batch image analysis
 
     # Output Configuration
     output_dir: str = "data/output"
@@ -157,6 +158,7 @@ class Config:
             "GEMINI_API_KEY": ("gemini_api_key", str),
             "GEMINI_RATE_LIMIT": ("gemini_rate_limit", int),
             "GEMINI_API_TIMEOUT": ("gemini_api_timeout", int),
+            "GEMINI_MAX_WORKERS": ("gemini_max_workers", int),
             "OUTPUT_DIR": ("output_dir", str),
             "DEFAULT_FORMAT": ("default_format", str),
             "LOG_LEVEL": ("log_level", str),
@@ -269,3 +271,28 @@ def reload_config(config_path: Path | None = None) -> Config:
     global _config
     _config = Config.load(config_path)
     return _config
+
+
+# Set once a .env file has been loaded; inherited by worker processes
+_ENV_LOADED_VAR = "LEX_PDFTOTEXT_ENV_LOADED"
+
+
+def load_env_file(env_path: Path) -> None:
+    """
+    Load variables from a .env file into the environment, once.
+
+    Call it before get_config() so .env values reach the configuration.
+    Variables already set in the environment take precedence. Worker
+    processes inherit the loaded variables, so they skip the file (and the
+    python-dotenv import).
+
+    Args:
+        env_path: Path to the .env file (ignored if it does not exist)
+    """
+    if os.environ.get(_ENV_LOADED_VAR) or not env_path.exists():
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(env_path, override=False)
+    os.environ[_ENV_LOADED_VAR] = "1"
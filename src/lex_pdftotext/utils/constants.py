@@ -7,14 +7,18 @@ the application to improve code readability and maintainability.
 
 # Extraction constants
 PAGE_LOG_INTERVAL = 50  # Log progress every N pages during extraction
+HEADER_PAGES = 2  # Leading pages parsed for header metadata (e.g. the `info` command)
+PAGES_PER_WORKER = 16  # Minimum pages per worker when extracting one PDF in parallel
 
 # Output formatting constants
 MAX_SUMMARY_ITEMS = 3  # Maximum items to show in CLI summaries
 MAX_DETAILED_ITEMS = 5  # Maximum items to show in detailed views
 FILENAME_DISPLAY_LENGTH = 30  # Truncate filenames to this length in progress bars
+OUTPUT_SUFFIXES = {"markdown": ".md", "json": ".json"}  # Output file suffix per format (else .txt)
 
 # File size constants
 BYTES_PER_MB = 1024 * 1024  # Bytes in a megabyte
+MOVE_THREADS = 8  # Threads moving merged PDFs to processado (os.replace releases the GIL)
 
 # RAG chunking constants
 DEFAULT_CHUNK_SIZE = 1000  # Default chunk size for RAG (from config)
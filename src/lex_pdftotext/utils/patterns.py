@@ -139,6 +139,7 @@ class RegexPatterns:
         r"SAMP|ES|SP|RJ|MG|DF|BA|PR|SC|RS|GO|MT|MS|PA|AM|RO|AC|"
         r"AP|RR|TO|MA|PI|CE|RN|PB|PE|AL|SE)\b"
     )
+    NON_LETTERS: Pattern = re.compile(r"[^A-ZÇÁÀÂÃÉÈÊÍÏÓÔÕÖÚÜÑa-zçáàâãéèêíïóôõöúüñ]")
 
     @staticmethod
     def extract_document_ids(text: str) -> list[str]:
@@ -157,26 +158,18 @@ class RegexPatterns:
             List of dicts with: id, line, position, context_before, context_after
         """
         results = []
-        lines = text.split("\n")
-        line_offsets = []
-        current_offset = 0
-
-        # Build line offset map
-        for line in lines:
-            line_offsets.append(current_offset)
-            current_offset += len(line) + 1  # +1 for newline
+        line_num = 1
+        last_pos = 0
 
         # Find all matches with positions
         for match in RegexPatterns.DOC_ID.finditer(text):
             doc_id = match.group(1)
             pos = match.start(1)  # Position of the captured group (the ID digits)
 
-            # Determine line number
-            line_num = 1
-            for i, offset in enumerate(line_offsets):
-                if offset > pos:
-                    break
-                line_num = i + 1
+            # Determine line number: matches come in order, so only count the
+            # newlines since the previous match (one linear pass over the text)
+            line_num += text.count("\n", last_pos, pos)
+            last_pos = pos
 
             # Extract context
             start_ctx = max(0, pos - context_chars)
@@ -265,7 +258,7 @@ class RegexPatterns:
     def is_all_caps(line: str) -> bool:
         """Check if a line is all uppercase (excluding numbers/symbols)."""
         # Remove numbers, spaces, and punctuation
-        letters_only = re.sub(r"[^A-ZÇÁÀÂÃÉÈÊÍÏÓÔÕÖÚÜÑa-zçáàâãéèêíïóôõöúüñ]", "", line)
+        letters_only = RegexPatterns.NON_LETTERS.sub("", line)
         if not letters_only:
             return False
         return letters_only.isupper()
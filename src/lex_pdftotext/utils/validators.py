@@ -147,7 +147,7 @@ class PDFValidator:
         return cls.validate_integrity(pdf_path, max_pages)
 
 
-def sanitize_output_path(user_input: str, base_dir: Path) -> Path:
+def sanitize_output_path(user_input: str | Path, base_dir: Path) -> Path:
     """Sanitize output path to prevent path traversal attacks.
 
     Args:
@@ -383,8 +383,9 @@ def estimate_output_size(pdf_path: Path, multiplier: float = 1.5) -> int:
     Returns:
         Estimated size in MB
     """
-    pdf_size_mb = pdf_path.stat().st_size / (1024 * 1024)
-    estimated_mb = int(pdf_size_mb * multiplier)
+    pdf_size = pdf_path.stat().st_size
+    pdf_size_mb = pdf_size / (1024 * 1024)
+    estimated_mb = estimate_output_size_from_bytes(pdf_size, multiplier)
 
     logger.debug(
         f"Estimated output size for {pdf_path.name}: "
@@ -392,3 +393,19 @@ def estimate_output_size(pdf_path: Path, multiplier: float = 1.5) -> int:
     )
 
     return estimated_mb
+
+
+def estimate_output_size_from_bytes(size_bytes: int, multiplier: float = 1.5) -> int:
+    """Estimate output size from a PDF size already known in bytes.
+
+    Useful for a whole batch: pass the summed size of all PDFs (e.g. from the
+    directory scan) instead of calling estimate_output_size() per file.
+
+    Args:
+        size_bytes: PDF size, or total size of several PDFs, in bytes
+        multiplier: Size multiplier (default: 1.5x)
+
+    Returns:
+        Estimated size in MB
+    """
+    return int(size_bytes / (1024 * 1024) * multiplier)
@@ -120,6 +120,27 @@ class TestMetadataParser:
         metadata = parser.parse(cert_text)
         assert metadata.is_certificate
 
+    def test_parse_header_matches_parse_summary_fields(self):
+        """Test header parsing fills the same summary fields as a full parse."""
+        parser = MetadataParser()
+        text = """
+        Processo: 5022930-18.2025.8.08.0012 Num. 12345678
+        Autor: João da Silva
+        Réu: Empresa XYZ Ltda
+        DECISÃO
+        I - RELATÓRIO
+        """
+        full = parser.parse(text)
+        header = parser.parse_header(text)
+
+        assert header.process_number == full.process_number
+        assert header.document_ids == full.document_ids
+        assert header.author == full.author
+        assert header.defendant == full.defendant
+        assert header.is_decision == full.is_decision
+        assert header.sections == []
+        assert header.document_positions == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -301,6 +301,47 @@ class TestImageAnalyzerBatch:
         assert results[0]["page_num"] == 1
         assert results[1]["page_num"] == 2
 
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("google.generativeai.configure")
+    @patch("google.generativeai.GenerativeModel")
+    def test_describe_images_batch_concurrent_keeps_order(self, mock_model_class, mock_configure):
+        """Test concurrent batch analysis returns results in input order."""
+        mock_model = MagicMock()
+
+        def fake_generate(content, request_options=None):
+            # Describe each image by its color so results can be matched to inputs
+            return MagicMock(text=str(content[1].getpixel((0, 0))))
+
+        mock_model.generate_content.side_effect = fake_generate
+        mock_model_class.return_value = mock_model
+
+        analyzer = ImageAnalyzer(enable_cache=False)
+
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (9, 9, 9)]
+        images = [
+            {"image": Image.new("RGB", (10, 10), color=color), "page_num": i}
+            for i, color in enumerate(colors, 1)
+        ]
+
+        results = analyzer.describe_images_batch(images, context="doc", max_workers=4)
+
+        assert [r["page_num"] for r in results] == [1, 2, 3, 4]
+        assert [r["description"] for r in results] == [str(c) for c in colors]
+        assert mock_model.generate_content.call_count == 4
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("google.generativeai.configure")
+    @patch("google.generativeai.GenerativeModel")
+    def test_describe_images_batch_empty(self, mock_model_class, mock_configure):
+        """Test empty batch returns without API calls."""
+        mock_model = MagicMock()
+        mock_model_class.return_value = mock_model
+
+        analyzer = ImageAnalyzer(enable_cache=False)
+
+        assert analyzer.describe_images_batch([]) == []
+        mock_model.generate_content.assert_not_called()
+
     @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
     @patch("google.generativeai.configure")
     @patch("google.generativeai.GenerativeModel")
@@ -327,7 +368,8 @@ class TestImageAnalyzerBatch:
             {"image": Image.new("RGB", (100, 100), color="green"), "page_num": 3},
         ]
 
-        results = analyzer.describe_images_batch(images, context="doc")
+        # Single worker: the mocked responses are consumed in call order
+        results = analyzer.describe_images_batch(images, context="doc", max_workers=1)
 
         # All 3 results should be present
         assert len(results) == 3
@@ -136,6 +136,20 @@ class TestJSONFormatterFormatToString:
         assert isinstance(result, str)
         assert "    " in result  # Should have 4-space indentation
 
+    def test_format_to_string_matches_stdlib_json(self, sample_text):
+        """Test output is identical whether or not orjson is installed."""
+        formatter = JSONFormatter()
+        data = formatter.format(sample_text, include_metadata=False, hierarchical=True)
+        result = formatter.format_to_string(sample_text, include_metadata=False, hierarchical=True)
+
+        assert result == json.dumps(data, ensure_ascii=False, indent=2)
+
+        # Compact output keeps the stdlib separators too
+        compact = formatter.format_to_string(
+            sample_text, include_metadata=False, hierarchical=True, indent=None
+        )
+        assert compact == json.dumps(data, ensure_ascii=False)
+
 
 class TestJSONFormatterDocumentType:
     """Test document type determination."""
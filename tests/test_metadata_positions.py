@@ -58,3 +58,21 @@ Texto do direito..."""
 
         assert len(metadata.section_anchors) >= 2
         assert "dos-fatos" in metadata.section_anchors or "DOS FATOS" in metadata.sections
+
+    def test_parser_reuses_given_positions(self):
+        """Parser should reuse precomputed positions for IDs and positions."""
+        from src.lex_pdftotext.utils.patterns import RegexPatterns
+
+        text = """Num. 11111111 - Petição Inicial
+
+Conforme exposto...
+
+Num. 22222222 - Decisão"""
+
+        positions = RegexPatterns.extract_document_ids_with_positions(text)
+        parser = MetadataParser()
+        metadata = parser.parse(text, document_positions=positions)
+
+        assert metadata.document_positions is positions
+        assert metadata.document_ids == ["11111111", "22222222"]
+        assert metadata.document_ids == parser.parse(text).document_ids
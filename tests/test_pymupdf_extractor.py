@@ -7,6 +7,7 @@ import pytest
 from PIL import Image
 
 from src.extractors.pymupdf_extractor import PyMuPDFExtractor
+from src.utils.constants import PAGES_PER_WORKER
 from src.utils.exceptions import PDFExtractionError
 from src.utils.timeout import TimeoutError
 
@@ -269,6 +270,76 @@ class TestPyMuPDFExtractorExtractText:
         assert "Page 1 text" in text
         assert "Page 3 text" in text
 
+    @patch("fitz.open")
+    def test_extract_text_skips_pages_without_fonts(self, mock_fitz_open, tmp_path):
+        """Test pages with no fonts (e.g. scanned images) are skipped without get_text()."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4\ntest")
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 2
+
+        mock_page1 = MagicMock()
+        mock_page1.get_fonts.return_value = []  # Image-only page
+        mock_page2 = MagicMock()
+        mock_page2.get_text.return_value = "Page 2 text"
+
+        mock_doc.__getitem__.side_effect = [mock_page1, mock_page2]
+        mock_fitz_open.return_value = mock_doc
+
+        extractor = PyMuPDFExtractor(pdf_file, validate=False)
+        text = extractor.extract_text()
+
+        assert text == "Page 2 text"
+        mock_page1.get_text.assert_not_called()
+
+    @patch("fitz.open")
+    def test_extract_text_pages_is_lazy(self, mock_fitz_open, tmp_path):
+        """Test extract_text_pages() yields one non-empty page at a time."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4\ntest")
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+
+        mock_page1 = MagicMock()
+        mock_page1.get_text.return_value = "Page 1 text"
+        mock_page2 = MagicMock()
+        mock_page2.get_text.return_value = "  \n "  # Whitespace only
+        mock_page3 = MagicMock()
+        mock_page3.get_text.return_value = "Page 3 text"
+
+        mock_doc.__getitem__.side_effect = [mock_page1, mock_page2, mock_page3]
+        mock_fitz_open.return_value = mock_doc
+
+        extractor = PyMuPDFExtractor(pdf_file, validate=False)
+        pages = extractor.extract_text_pages()
+
+        assert next(pages) == "Page 1 text"
+        mock_page3.get_text.assert_not_called()
+        assert list(pages) == ["Page 3 text"]
+
+    def test_extract_text_parallel_matches_sequential(self, tmp_path):
+        """Test extract_text(workers=...) splits pages into blocks, keeping order."""
+        import fitz
+
+        pdf_file = tmp_path / "long.pdf"
+        doc = fitz.open()
+        for i in range(2 * PAGES_PER_WORKER + 3):
+            page = doc.new_page()
+            if i != 5:  # Leave one page empty
+                page.insert_text((72, 72), f"Conteúdo da página {i + 1}")
+        doc.save(pdf_file)
+        doc.close()
+
+        with PyMuPDFExtractor(pdf_file, validate=False) as extractor:
+            sequential = extractor.extract_text()
+            parallel = extractor.extract_text(workers=2)
+
+        assert parallel == sequential
+        assert "página 6\n" not in parallel
+        assert parallel.index("página 2\n") < parallel.index(f"página {2 * PAGES_PER_WORKER}")
+
 
 class TestPyMuPDFExtractorExtractTextByPage:
     """Test extract_text_by_page() method."""
@@ -298,6 +369,52 @@ class TestPyMuPDFExtractorExtractTextByPage:
         assert pages[1] == "Page 2"
 
 
+class TestPyMuPDFExtractorExtractFirstPagesText:
+    """Test extract_first_pages_text() method."""
+
+    @patch("fitz.open")
+    def test_extract_first_pages_text_reads_only_leading_pages(self, mock_fitz_open, tmp_path):
+        """Test only the first n pages are read."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4\ntest")
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 3
+
+        mock_page1 = MagicMock()
+        mock_page1.get_text.return_value = "Page 1"
+        mock_page2 = MagicMock()
+        mock_page2.get_text.return_value = "Page 2"
+        mock_page3 = MagicMock()
+        mock_page3.get_text.return_value = "Page 3"
+
+        mock_doc.__getitem__.side_effect = [mock_page1, mock_page2, mock_page3]
+        mock_fitz_open.return_value = mock_doc
+
+        extractor = PyMuPDFExtractor(pdf_file, validate=False)
+        text = extractor.extract_first_pages_text(n=2)
+
+        assert text == "Page 1\n\nPage 2"
+        mock_page3.get_text.assert_not_called()
+
+    @patch("fitz.open")
+    def test_extract_first_pages_text_short_document(self, mock_fitz_open, tmp_path):
+        """Test n larger than the page count reads every page."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4\ntest")
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "Only page"
+        mock_doc.__getitem__.return_value = mock_page
+        mock_fitz_open.return_value = mock_doc
+
+        extractor = PyMuPDFExtractor(pdf_file, validate=False)
+
+        assert extractor.extract_first_pages_text(n=5) == "Only page"
+
+
 class TestPyMuPDFExtractorGetMetadata:
     """Test get_metadata() method."""
 
@@ -436,6 +553,7 @@ class TestPyMuPDFExtractorExtractTextWithFormatting:
         assert "Page 2" in text
         # Should have page markers
         assert "PÁGINA" in text
+        assert text == "--- PÁGINA 1 ---\n\nPage 1\n\n--- PÁGINA 2 ---\n\nPage 2"
 
 
 class TestPyMuPDFExtractorExtractImages:
@@ -520,6 +638,44 @@ class TestPyMuPDFExtractorExtractImages:
         assert len(images) == 0
 
 
+class TestPyMuPDFExtractorExtractTextAndImages:
+    """Test extract_text_and_images() method."""
+
+    @patch("fitz.open")
+    def test_extract_text_and_images_single_pass(self, mock_fitz_open, tmp_path):
+        """Test text and images come from one load of each page."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4\ntest")
+
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 2
+
+        test_img = Image.new("RGB", (50, 40), color="blue")
+        img_bytes = io.BytesIO()
+        test_img.save(img_bytes, format="PNG")
+
+        mock_page1 = MagicMock()
+        mock_page1.get_text.return_value = "Page 1 text"
+        mock_page1.get_images.return_value = []
+        mock_page2 = MagicMock()
+        mock_page2.get_text.return_value = "Page 2 text"
+        mock_page2.get_images.return_value = [(7, 0, 0, 0, 0, 0, 0)]
+
+        # side_effect list: each page can only be loaded once
+        mock_doc.__getitem__.side_effect = [mock_page1, mock_page2]
+        mock_doc.extract_image.return_value = {"image": img_bytes.getvalue(), "ext": "png"}
+        mock_fitz_open.return_value = mock_doc
+
+        extractor = PyMuPDFExtractor(pdf_file, validate=False)
+        text, images = extractor.extract_text_and_images()
+
+        assert text == "Page 1 text\n\nPage 2 text"
+        assert len(images) == 1
+        assert images[0]["page_num"] == 2
+        assert images[0]["xref"] == 7
+        assert images[0]["width"] == 50
+
+
 class TestPyMuPDFExtractorClose:
     """Test close() method."""
 
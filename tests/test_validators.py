@@ -17,6 +17,7 @@ from src.utils.validators import (
     PDFValidator,
     check_disk_space,
     estimate_output_size,
+    estimate_output_size_from_bytes,
     sanitize_output_path,
     validate_chunk_size,
     validate_filename,
@@ -496,3 +497,10 @@ class TestEstimateOutputSize:
 
         # Should be 0 MB (rounds down)
         assert estimated_mb == 0
+
+    def test_estimate_output_size_from_bytes(self):
+        """Test estimation from a size already known in bytes (e.g. a batch total)."""
+        # 10MB * 1.5 = 15MB, same as estimate_output_size() for a 10MB file
+        assert estimate_output_size_from_bytes(10 * 1024 * 1024) == 15
+        assert estimate_output_size_from_bytes(20 * 1024 * 1024, multiplier=2.0) == 40
+        assert estimate_output_size_from_bytes(0) == 0
@@ -5,6 +5,7 @@ Build verification script for PDF Text Extractor.
 Runs smoke tests on the built executable to ensure it works correctly.
 """
 
+import os
 import subprocess
 import sys
 import tempfile
@@ -115,8 +116,11 @@ def check_sample_pdf_processing(exe_path: Path, sample_pdf: Path) -> bool:
 
             if result.returncode == 0:
                 # Check output file was created
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
+                try:
+                    file_size = os.stat(output_path).st_size
+                except FileNotFoundError:
+                    file_size = 0
+                if file_size > 0:
                     print_success(f"PDF processing works (output: {file_size} bytes)")
                     return True
                 else:
@@ -128,8 +132,7 @@ def check_sample_pdf_processing(exe_path: Path, sample_pdf: Path) -> bool:
 
         finally:
             # Cleanup
-            if output_path.exists():
-                output_path.unlink()
+            output_path.unlink(missing_ok=True)
 
     except subprocess.TimeoutExpired:
         print_error("PDF processing timed out (> 60s)")